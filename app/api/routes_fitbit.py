@@ -40,6 +40,24 @@ _SETTINGS_REDIRECT_PATH = "/settings"
 _oauth_states = {}
 
 
+def _issue_oauth_state(profile_id: int) -> str:
+    """
+    Generate a CSRF state token and remember which profile it belongs to.
+
+    Args:
+        profile_id: Profile initiating the OAuth flow
+
+    Returns:
+        URL-safe state token to round-trip through Fitbit
+    """
+    state = secrets.token_urlsafe(32)
+
+    # Store state with profile_id (expires after 10 minutes in production)
+    _oauth_states[state] = profile_id
+
+    return state
+
+
 def _is_safe_redirect_url(url: str) -> bool:
     """
     Validate that a URL is safe for redirect (relative path only, no external domains).
@@ -118,10 +136,7 @@ async def initiate_connection(
     State token is stored for CSRF protection.
     """
     # Generate state token for CSRF protection
-    state = secrets.token_urlsafe(32)
-
-    # Store state with profile_id (expires after 10 minutes in production)
-    _oauth_states[state] = profile_id
+    state = _issue_oauth_state(profile_id)
 
     # Generate auth URL
     auth_url = fitbit_oauth.generate_auth_url(state)
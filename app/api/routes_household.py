@@ -43,7 +43,7 @@ def list_household_tasks(
     """
     if frequency:
         tasks = household_service.get_household_tasks_by_frequency(db, frequency, include_inactive)
-        return [household_service.get_task_with_status(db, task.id) for task in tasks]
+        return household_service.get_tasks_with_status(db, tasks)
     else:
         return household_service.get_all_tasks_with_status(db, include_inactive)
 
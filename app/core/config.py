@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     # Sync settings
     fitbit_sync_interval_hours: int = 1
     fitbit_backfill_days: int = 7
+    fitbit_max_concurrency: int = 4  # Concurrent Fitbit fetches per sync
 
 
 settings = Settings()
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
 from sqlalchemy.orm import Session
 from contextlib import asynccontextmanager
+import hashlib
 import logging
 import time
 
@@ -27,6 +28,14 @@ from app.services import tasks as task_service, profiles as profile_service
 # Cache bust value for static assets (prevents browser caching issues)
 CACHE_BUST = str(int(time.time()))
 
+# Pre-serialized health check payload (hit every few seconds by container probes)
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+# Rendered HTML + ETag for pages whose output only depends on the route, CACHE_BUST
+# and a few small context values; bounded because keys can include today's date
+_STATIC_PAGE_CACHE: dict = {}
+_STATIC_PAGE_CACHE_SIZE = 16
+
 
 # Configure application logging
 logging.basicConfig(
@@ -241,13 +250,37 @@ async def home(request: Request, db: Session = Depends(get_db), profile_id: int
     })
 
 
+def _render_static_page(request: Request, template_name: str, **context) -> Response:
+    """
+    Render a page once per distinct context and serve it with an ETag.
+
+    Only use for pages whose HTML depends solely on the hashable keyword
+    context passed here. Browsers that send a matching If-None-Match get a
+    304 without a body.
+    """
+    key = (template_name, tuple(sorted(context.items())))
+    cached = _STATIC_PAGE_CACHE.get(key)
+    if cached is None:
+        rendered = templates.TemplateResponse(request, template_name, {
+            "request": request,
+            "cache_bust": CACHE_BUST,
+            **context
+        })
+        etag = f'"{hashlib.blake2b(rendered.body, digest_size=16).hexdigest()}"'
+        if len(_STATIC_PAGE_CACHE) >= _STATIC_PAGE_CACHE_SIZE:
+            _STATIC_PAGE_CACHE.clear()
+        cached = _STATIC_PAGE_CACHE[key] = (rendered.body, etag)
+
+    body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return HTMLResponse(content=body, headers={"ETag": etag})
+
+
 @app.get("/settings", response_class=HTMLResponse)
 async def settings(request: Request):
     """Settings page for preferences, profiles, and integrations."""
-    return templates.TemplateResponse(request, "settings.html", {
-        "request": request,
-        "cache_bust": CACHE_BUST
-    })
+    return _render_static_page(request, "settings.html")
 
 
 @app.get("/lists", response_class=HTMLResponse)
@@ -309,12 +342,13 @@ async def fitbit(request: Request, db: Session = Depends(get_db), profile_id: in
     fitbit_connected = connection is not None
     today = get_today()
 
-    return templates.TemplateResponse(request, "fitbit.html", {
-        "request": request,
-        "fitbit_connected": fitbit_connected,
-        "today": today.isoformat(),
-        "cache_bust": CACHE_BUST
-    })
+    # Only two variants per day (connected or not), so the rendered page is cached
+    return _render_static_page(
+        request,
+        "fitbit.html",
+        fitbit_connected=fitbit_connected,
+        today=today.isoformat()
+    )
 
 
 @app.get("/household", response_class=HTMLResponse)
@@ -358,13 +392,10 @@ async def history(request: Request):
 @app.get("/profiles", response_class=HTMLResponse)
 async def profiles(request: Request):
     """Profile management page for selecting and managing user profiles."""
-    return templates.TemplateResponse(request, "profiles.html", {
-        "request": request,
-        "cache_bust": CACHE_BUST
-    })
+    return _render_static_page(request, "profiles.html")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint for Docker."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -4,7 +4,7 @@ Household Completion Model
 Tracks completion history for household tasks with profile attribution.
 Records WHO completed a task and WHEN.
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.core.db import Base
 
@@ -28,5 +28,10 @@ class HouseholdCompletion(Base):
     )
     notes = Column(String, nullable=True)
 
+    __table_args__ = (
+        # Latest-completion-per-task lookups seek this index instead of sorting
+        Index('ix_household_completions_task_completed_at', 'household_task_id', 'completed_at'),
+    )
+
     def __repr__(self):
         return f"<HouseholdCompletion(id={self.id}, task_id={self.household_task_id}, profile_id={self.completed_by_profile_id})>"
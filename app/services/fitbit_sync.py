@@ -7,6 +7,7 @@ Handles:
 - Historical data import
 - Hourly sync updates
 """
+import asyncio
 import logging
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.sqlite import insert
@@ -17,7 +18,7 @@ from app.core.time import get_today, get_now, to_timezone_aware
 from app.core.config import settings
 from app.models.fitbit_connection import FitbitConnection
 from app.models.fitbit_metric import FitbitMetric
-from app.services import fitbit_api, fitbit_connection
+from app.services import fitbit_api, fitbit_connection, fitbit_oauth
 from app.services.fitbit_checks import evaluate_and_apply_auto_checks
 
 logger = logging.getLogger(__name__)
@@ -43,37 +44,60 @@ async def upsert_metrics(
     Returns:
         Number of metrics upserted
     """
-    count = 0
+    return await upsert_metrics_for_dates(db, profile_id, {target_date: metrics})
 
-    for metric_type, metric_data in metrics.items():
-        # Prepare data for upsert
-        data = {
+
+async def upsert_metrics_for_dates(
+    db: Session,
+    profile_id: int,
+    metrics_by_date: Dict[date, Dict[str, Dict[str, any]]]
+) -> int:
+    """
+    Upsert Fitbit metrics for several dates with a single statement.
+
+    All rows go through one INSERT ... ON CONFLICT UPDATE executed with
+    many parameter sets, followed by one commit.
+
+    Args:
+        db: Database session
+        profile_id: Profile ID
+        metrics_by_date: Dictionary of {date: {metric_type: {value, unit, metadata}}}
+
+    Returns:
+        Number of metrics upserted
+    """
+    synced_at = get_now()
+    rows = [
+        {
             "user_id": profile_id,
             "date": target_date,
             "metric_type": metric_type,
             "value": metric_data["value"],
             "unit": metric_data.get("unit"),
             "extra_data": metric_data.get("extra_data"),
-            "synced_at": get_now()
+            "synced_at": synced_at
         }
+        for target_date, metrics in metrics_by_date.items()
+        for metric_type, metric_data in metrics.items()
+    ]
+    if not rows:
+        return 0
+
+    # Use INSERT ... ON CONFLICT UPDATE
+    stmt = insert(FitbitMetric)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "date", "metric_type"],
+        set_={
+            "value": stmt.excluded.value,
+            "unit": stmt.excluded.unit,
+            "extra_data": stmt.excluded.extra_data,
+            "synced_at": stmt.excluded.synced_at
+        }
+    )
 
-        # Use INSERT ... ON CONFLICT UPDATE
-        stmt = insert(FitbitMetric).values(**data)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["user_id", "date", "metric_type"],
-            set_={
-                "value": stmt.excluded.value,
-                "unit": stmt.excluded.unit,
-                "extra_data": stmt.excluded.extra_data,
-                "synced_at": stmt.excluded.synced_at
-            }
-        )
-
-        db.execute(stmt)
-        count += 1
-
+    db.execute(stmt, rows)
     db.commit()
-    return count
+    return len(rows)
 
 
 async def sync_profile_date_range(
@@ -102,41 +126,83 @@ async def sync_profile_date_range(
     error_days = 0
     total_metrics = 0
     errors: list[dict[str, str]] = []
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+    # Refresh the token once up front so concurrent fetches don't each try to
+    # rotate it (Fitbit refresh tokens are single-use). Without a valid token
+    # every fetch would retry the refresh itself, so give up on the range.
+    try:
+        connection = await fitbit_oauth.ensure_valid_token(db, connection)
+    except Exception as e:
+        logger.warning("Fitbit token refresh failed for profile %s: %s", profile_id, e)
+        db.rollback()
+        errors = [{"date": d.isoformat(), "error": f"Token refresh failed: {e}"} for d in dates]
+        return _finish_sync(db, connection, 0, len(dates), 0, errors)
+
+    # Fetch all dates concurrently, bounded to avoid bursting the Fitbit API
+    semaphore = asyncio.Semaphore(settings.fitbit_max_concurrency)
+
+    async def _fetch(target_date: date):
+        async with semaphore:
+            return await fitbit_api.fetch_all_metrics(db, connection, target_date)
+
+    results = await asyncio.gather(*(_fetch(d) for d in dates), return_exceptions=True)
+
+    # Collect metrics for one batched upsert
+    fetched: Dict[date, Dict[str, Dict[str, any]]] = {}
+    for current_date, metrics in zip(dates, results):
+        if isinstance(metrics, Exception):
+            logger.warning("Error syncing Fitbit date %s for profile %s: %s", current_date, profile_id, metrics)
+            error_days += 1
+            errors.append({
+                "date": current_date.isoformat(),
+                "error": str(metrics)
+            })
+        elif metrics:
+            fetched[current_date] = metrics
+        else:
+            # No metrics available (might be future date or no data)
+            error_days += 1
+            errors.append({
+                "date": current_date.isoformat(),
+                "error": "No metrics returned from Fitbit API"
+            })
 
-    # Iterate through date range
-    current_date = start_date
-    while current_date <= end_date:
+    if fetched:
         try:
-            # Fetch all metrics for the date
-            metrics = await fitbit_api.fetch_all_metrics(db, connection, current_date)
-
-            if metrics:
-                # Upsert metrics
-                count = await upsert_metrics(db, profile_id, current_date, metrics)
-                total_metrics += count
-                success_days += 1
-
-                # Run auto-check evaluation for this date
-                await evaluate_and_apply_auto_checks(db, profile_id, current_date)
-            else:
-                # No metrics available (might be future date or no data)
-                error_days += 1
-                errors.append({
-                    "date": current_date.isoformat(),
-                    "error": "No metrics returned from Fitbit API"
-                })
-
+            total_metrics = await upsert_metrics_for_dates(db, profile_id, fetched)
+            success_days = len(fetched)
+        except Exception as e:
+            logger.warning("Error storing Fitbit metrics for profile %s: %s", profile_id, e)
+            db.rollback()
+            error_days += len(fetched)
+            errors.extend({"date": synced_date.isoformat(), "error": str(e)} for synced_date in fetched)
+            fetched = {}
+
+    # Run auto-check evaluation for each synced date
+    for synced_date in fetched:
+        try:
+            await evaluate_and_apply_auto_checks(db, profile_id, synced_date)
         except Exception as e:
-            logger.warning("Error syncing Fitbit date %s for profile %s: %s", current_date, profile_id, e)
+            logger.warning("Error applying Fitbit auto-checks on %s for profile %s: %s", synced_date, profile_id, e)
             error_days += 1
             errors.append({
-                "date": current_date.isoformat(),
+                "date": synced_date.isoformat(),
                 "error": str(e)
             })
 
-        current_date += timedelta(days=1)
+    return _finish_sync(db, connection, success_days, error_days, total_metrics, errors)
+
 
-    # Update connection sync status
+def _finish_sync(
+    db: Session,
+    connection: FitbitConnection,
+    success_days: int,
+    error_days: int,
+    total_metrics: int,
+    errors: list[dict[str, str]]
+) -> Dict:
+    """Record the sync status on the connection and build the sync result."""
     connection.last_sync_at = get_now()
     if error_days == 0:
         connection.last_sync_status = "success"
@@ -247,6 +313,9 @@ async def sync_all_connected_profiles(db: Session) -> Dict[int, Dict]:
     # Get all connections
     connections = db.query(FitbitConnection).all()
 
+    # Profiles sync one after another: they share this session, which must not
+    # be used by concurrent tasks. Each profile's dates are still fetched
+    # concurrently, so fitbit_max_concurrency bounds the whole sync.
     for connection in connections:
         try:
             result = await sync_profile_smart(
@@ -1,12 +1,27 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
 from app.models.daily_status import DailyStatus
 from app.models.fitbit_metric import FitbitMetric
 from app.models.task import Task
 from app.models.task_check import TaskCheck
 from datetime import date
 from calendar import monthrange
-from typing import Dict, Any, Set
+from functools import lru_cache
+from typing import Dict, Any, Set, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _month_meta(year: int, month: int) -> Tuple[int, int]:
+    """Return (first_day_weekday, days_in_month) for a month; 0=Monday."""
+    return monthrange(year, month)
+
+
+@lru_cache(maxsize=256)
+def _month_dates(year: int, month: int) -> Tuple[Tuple[date, str], ...]:
+    """Return (date, ISO string) pairs for every day of a month."""
+    days_in_month = _month_meta(year, month)[1]
+    day_dates = [date(year, month, day) for day in range(1, days_in_month + 1)]
+    return tuple((day_date, day_date.isoformat()) for day_date in day_dates)
 
 
 def get_calendar_month_data(db: Session, year: int, month: int, profile_id: int) -> Dict[str, Any]:
@@ -20,23 +35,20 @@ def get_calendar_month_data(db: Session, year: int, month: int, profile_id: int)
     """
     from app.core.time import get_today
 
-    # Get first and last day of month
+    # Get first and last day of month, and first day weekday (0=Monday in Python)
+    first_day_weekday, days_in_month = _month_meta(year, month)
     first_day = date(year, month, 1)
-    days_in_month = monthrange(year, month)[1]
     last_day = date(year, month, days_in_month)
     today = get_today()
 
-    # Get first day weekday (0=Monday in Python)
-    first_day_weekday = first_day.weekday()
-
-    # Query all daily statuses for the month for this profile
-    completed_days = db.query(DailyStatus).filter(
-        and_(
-            DailyStatus.date >= first_day,
-            DailyStatus.date <= last_day,
+    # Query only the columns needed from the month's daily statuses for this profile,
+    # streaming rows in batches rather than materializing them up front
+    completed_days = db.execute(
+        select(DailyStatus.date, DailyStatus.completed_at).where(
+            DailyStatus.date.between(first_day, last_day),
             DailyStatus.user_id == profile_id
-        )
-    ).all()
+        ).execution_options(yield_per=1000)
+    )
 
     # Create a map of date -> completion status
     completed_dates = {
@@ -96,10 +108,7 @@ def get_calendar_month_data(db: Session, year: int, month: int, profile_id: int)
 
     # Build days dictionary with all dates in month
     days_dict = {}
-    for day in range(1, days_in_month + 1):
-        day_date = date(year, month, day)
-        date_str = day_date.isoformat()
-
+    for day_date, date_str in _month_dates(year, month):
         # Filter required tasks to only those active on this specific date
         # Respects active_since field to prevent new tasks from affecting historical completion
         required_task_ids_for_date = {
@@ -155,7 +164,7 @@ def get_month_completion_stats(db: Session, year: int, month: int, profile_id: i
     from app.core.time import get_today
 
     first_day = date(year, month, 1)
-    days_in_month = monthrange(year, month)[1]
+    days_in_month = _month_meta(year, month)[1]
     last_day = date(year, month, days_in_month)
     today = get_today()
 
@@ -172,15 +181,14 @@ def get_month_completion_stats(db: Session, year: int, month: int, profile_id: i
     # Count total days that should be evaluated
     total_days = (end_date - first_day).days + 1
 
-    # Count completed days for this profile
-    completed_count = db.query(DailyStatus).filter(
-        and_(
-            DailyStatus.date >= first_day,
-            DailyStatus.date <= end_date,
-            DailyStatus.completed_at.isnot(None),
+    # Count completed days for this profile with a single aggregate
+    # (COUNT(column) skips NULLs, so incomplete days are not counted)
+    completed_count = db.scalar(
+        select(func.count(DailyStatus.completed_at)).where(
+            DailyStatus.date.between(first_day, end_date),
             DailyStatus.user_id == profile_id
         )
-    ).count()
+    )
 
     completion_rate = (completed_count / total_days * 100) if total_days > 0 else 0
 
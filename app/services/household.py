@@ -5,10 +5,11 @@ CRITICAL ARCHITECTURE NOTE:
 Unlike other services, household tasks are SHARED across all profiles (no profile_id filtering).
 profile_id is ONLY used for completion attribution (tracking WHO completed a task).
 """
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import date, timedelta
+from types import MappingProxyType
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import bindparam, desc, func, select
 
 from app.models.household_task import HouseholdTask
 from app.models.household_completion import HouseholdCompletion
@@ -16,14 +17,14 @@ from app.models.profile import Profile
 from app.core.time import get_now, get_today
 
 
-# Frequency thresholds in days
-FREQUENCY_THRESHOLDS = {
+# Frequency thresholds in days (read-only; shared by every status/due-date calculation)
+FREQUENCY_THRESHOLDS = MappingProxyType({
     'weekly': 7,
     'biweekly': 14,
     'monthly': 30,
     'quarterly': 90,
     'annual': 365
-}
+})
 
 # Default icon mappings based on task keywords
 DEFAULT_ICONS = {
@@ -331,9 +332,10 @@ def get_task_status_next_due_date(
             if task.next_due_date is not None:
                 return task.next_due_date
 
-            if task.frequency in FREQUENCY_THRESHOLDS:
+            interval_days = FREQUENCY_THRESHOLDS.get(task.frequency)
+            if interval_days is not None:
                 completion_date = last_completion.completed_at.date()
-                return completion_date + timedelta(days=FREQUENCY_THRESHOLDS[task.frequency])
+                return completion_date + timedelta(days=interval_days)
 
             return None
 
@@ -656,8 +658,8 @@ def mark_task_complete(db: Session, task_id: int, profile_id: int, notes: Option
     if task.schedule_mode == 'rolling':
         # Rolling mode: Calculate from completion date using fixed intervals
         # Ignore calendar recurrence config - use interval-based calculation
-        if task.frequency in FREQUENCY_THRESHOLDS:
-            interval_days = FREQUENCY_THRESHOLDS[task.frequency]
+        interval_days = FREQUENCY_THRESHOLDS.get(task.frequency)
+        if interval_days is not None:
             task.next_due_date = completion_date + timedelta(days=interval_days)
         else:
             # Fallback for todo or unknown frequencies
@@ -673,6 +675,15 @@ def mark_task_complete(db: Session, task_id: int, profile_id: int, notes: Option
     return completion
 
 
+# Built once and reused for every per-task "latest completion" lookup
+_LAST_COMPLETION_STMT = (
+    select(HouseholdCompletion)
+    .where(HouseholdCompletion.household_task_id == bindparam('task_id'))
+    .order_by(desc(HouseholdCompletion.completed_at))
+    .limit(1)
+)
+
+
 def get_last_completion(db: Session, task_id: int) -> Optional[HouseholdCompletion]:
     """
     Get the most recent completion for a task.
@@ -684,12 +695,78 @@ def get_last_completion(db: Session, task_id: int) -> Optional[HouseholdCompleti
     Returns:
         Most recent HouseholdCompletion or None
     """
-    return (
-        db.query(HouseholdCompletion)
+    return db.scalars(_LAST_COMPLETION_STMT, {'task_id': task_id}).first()
+
+
+def get_last_completion_with_profile_name(
+    db: Session,
+    task_id: int
+) -> Tuple[Optional[HouseholdCompletion], Optional[str]]:
+    """
+    Get the most recent completion for a task together with the completer's name.
+
+    Joins the profile in the same query so callers don't need a second lookup.
+
+    Args:
+        db: Database session
+        task_id: Household task ID
+
+    Returns:
+        (HouseholdCompletion, profile name) or (None, None) if never completed
+    """
+    row = (
+        db.query(HouseholdCompletion, Profile.name)
+        .outerjoin(Profile, HouseholdCompletion.completed_by_profile_id == Profile.id)
         .filter(HouseholdCompletion.household_task_id == task_id)
         .order_by(desc(HouseholdCompletion.completed_at))
         .first()
     )
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+def get_last_completions_with_profile_names(
+    db: Session,
+    task_ids: List[int]
+) -> Dict[int, Tuple[HouseholdCompletion, Optional[str]]]:
+    """
+    Get the most recent completion and completer name for many tasks at once.
+
+    Args:
+        db: Database session
+        task_ids: Household task IDs
+
+    Returns:
+        Dict mapping task ID to (HouseholdCompletion, profile name); tasks that
+        were never completed are omitted
+    """
+    if not task_ids:
+        return {}
+
+    latest = (
+        select(
+            HouseholdCompletion.household_task_id,
+            func.max(HouseholdCompletion.completed_at).label('last_completed_at')
+        )
+        .where(HouseholdCompletion.household_task_id.in_(task_ids))
+        .group_by(HouseholdCompletion.household_task_id)
+        .subquery()
+    )
+    rows = (
+        db.query(HouseholdCompletion, Profile.name)
+        .join(
+            latest,
+            (HouseholdCompletion.household_task_id == latest.c.household_task_id)
+            & (HouseholdCompletion.completed_at == latest.c.last_completed_at)
+        )
+        .outerjoin(Profile, HouseholdCompletion.completed_by_profile_id == Profile.id)
+        .order_by(HouseholdCompletion.id)
+        .all()
+    )
+
+    # If two completions share the latest timestamp, keep the newer row
+    return {completion.household_task_id: (completion, profile_name) for completion, profile_name in rows}
 
 
 def get_completion_history(db: Session, task_id: int, limit: int = 10) -> List[Dict]:
@@ -704,26 +781,23 @@ def get_completion_history(db: Session, task_id: int, limit: int = 10) -> List[D
     Returns:
         List of completion dicts with profile names
     """
-    completions = (
-        db.query(HouseholdCompletion, Profile.name)
+    # Select only the columns the history needs so no ORM instances are built
+    rows = db.execute(
+        select(
+            HouseholdCompletion.id,
+            HouseholdCompletion.household_task_id,
+            HouseholdCompletion.completed_at,
+            HouseholdCompletion.completed_by_profile_id,
+            Profile.name.label('completed_by_profile_name'),
+            HouseholdCompletion.notes
+        )
         .join(Profile, HouseholdCompletion.completed_by_profile_id == Profile.id)
-        .filter(HouseholdCompletion.household_task_id == task_id)
+        .where(HouseholdCompletion.household_task_id == task_id)
         .order_by(desc(HouseholdCompletion.completed_at))
         .limit(limit)
-        .all()
-    )
+    ).mappings()
 
-    return [
-        {
-            'id': completion.id,
-            'household_task_id': completion.household_task_id,
-            'completed_at': completion.completed_at,
-            'completed_by_profile_id': completion.completed_by_profile_id,
-            'completed_by_profile_name': profile_name,
-            'notes': completion.notes
-        }
-        for completion, profile_name in completions
-    ]
+    return [dict(row) for row in rows]
 
 
 def undo_last_completion(db: Session, task_id: int) -> bool:
@@ -753,12 +827,7 @@ def undo_last_completion(db: Session, task_id: int) -> bool:
     db.delete(last_completion)
 
     # Recalculate next_due_date based on previous completion (if any)
-    previous_completion = (
-        db.query(HouseholdCompletion)
-        .filter(HouseholdCompletion.household_task_id == task_id)
-        .order_by(desc(HouseholdCompletion.completed_at))
-        .first()
-    )
+    previous_completion = get_last_completion(db, task_id)
 
     if previous_completion:
         # Recalculate from the previous completion
@@ -766,8 +835,8 @@ def undo_last_completion(db: Session, task_id: int) -> bool:
 
         if task.schedule_mode == 'rolling':
             # Rolling mode: Calculate from previous completion date
-            if task.frequency in FREQUENCY_THRESHOLDS:
-                interval_days = FREQUENCY_THRESHOLDS[task.frequency]
+            interval_days = FREQUENCY_THRESHOLDS.get(task.frequency)
+            if interval_days is not None:
                 task.next_due_date = completion_date + timedelta(days=interval_days)
             else:
                 task.next_due_date = None
@@ -811,8 +880,17 @@ def get_task_with_status(db: Session, task_id: int, upcoming_days_threshold: int
     if not task:
         return None
 
-    last_completion = get_last_completion(db, task_id)
+    last_completion, profile_name = get_last_completion_with_profile_name(db, task_id)
+    return _build_task_status(task, last_completion, profile_name, upcoming_days_threshold)
 
+
+def _build_task_status(
+    task: HouseholdTask,
+    last_completion: Optional[HouseholdCompletion],
+    profile_name: Optional[str],
+    upcoming_days_threshold: int = 7
+) -> Dict:
+    """Build the status dict for a task from its already-loaded last completion."""
     result = {
         'id': task.id,
         'title': task.title,
@@ -850,9 +928,7 @@ def get_task_with_status(db: Session, task_id: int, upcoming_days_threshold: int
     }
 
     if last_completion:
-        # Get profile name
-        profile = db.query(Profile).filter(Profile.id == last_completion.completed_by_profile_id).first()
-        profile_name = profile.name if profile else "Unknown"
+        profile_name = profile_name or "Unknown"
 
         # Handle timezone-aware vs naive datetime comparison
         now = get_now()
@@ -963,6 +1039,28 @@ def get_task_with_status(db: Session, task_id: int, upcoming_days_threshold: int
     return result
 
 
+def get_tasks_with_status(db: Session, tasks: List[HouseholdTask], upcoming_days_threshold: int = 7) -> List[Dict]:
+    """
+    Enrich already-loaded household tasks with completion status.
+
+    Loads the last completion (and completer name) for every task in one
+    query instead of one lookup per task.
+
+    Args:
+        db: Database session
+        tasks: Household tasks to enrich
+        upcoming_days_threshold: Number of days to look ahead for "coming soon" tasks (default: 7)
+
+    Returns:
+        List of dicts with task and status info, in the order of tasks
+    """
+    last_completions = get_last_completions_with_profile_names(db, [task.id for task in tasks])
+    return [
+        _build_task_status(task, *last_completions.get(task.id, (None, None)), upcoming_days_threshold)
+        for task in tasks
+    ]
+
+
 def get_all_tasks_with_status(db: Session, include_inactive: bool = False, include_completed_todos: bool = False) -> List[Dict]:
     """
     Get all household tasks enriched with completion status.
@@ -976,7 +1074,7 @@ def get_all_tasks_with_status(db: Session, include_inactive: bool = False, inclu
         List of dicts with task and status info
     """
     tasks = get_all_household_tasks(db, include_inactive=include_inactive)
-    tasks_with_status = [get_task_with_status(db, task.id) for task in tasks]
+    tasks_with_status = get_tasks_with_status(db, tasks)
 
     # Filter out completed to-dos unless explicitly requested
     if not include_completed_todos:
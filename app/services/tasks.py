@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from app.models.task import Task
 from app.models.task_check import TaskCheck
 from app.schemas.task import TaskCreate, TaskUpdate
@@ -116,7 +116,8 @@ def get_default_task_icon(title: str) -> str:
     return 'check-circle'
 
 
-DEFAULT_TASKS = [
+# Default tasks seeded for a new profile
+DEFAULT_TASKS = (
     {
         "title": "Walk 10,000 steps",
         "sort_order": 1,
@@ -164,16 +165,14 @@ DEFAULT_TASKS = [
         "is_active": True,
         "task_type": "daily"
     },
-]
+)
 
 
 def seed_default_tasks(db: Session, profile_id: int = 1) -> None:
     """Seed default tasks for a specific profile if no tasks exist for that profile."""
     count = db.query(func.count(Task.id)).filter(Task.user_id == profile_id).scalar()
     if count == 0:
-        for task_data in DEFAULT_TASKS:
-            task = Task(**task_data, user_id=profile_id)
-            db.add(task)
+        db.execute(insert(Task), [{**task_data, "user_id": profile_id} for task_data in DEFAULT_TASKS])
         db.commit()
 
 
@@ -0,0 +1,26 @@
+"""add compound index for latest household completion lookups
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_household_completions_task_completed_at",
+        "household_completions",
+        ["household_task_id", "completed_at"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_household_completions_task_completed_at", table_name="household_completions")
@@ -1,14 +1,18 @@
 import pytest
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
-from datetime import date
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 import os
-from freezegun import freeze_time
+import time_machine
 
 from app.core.db import Base, get_db
 from app.main import app
 from app.core.config import settings
+from app.core.encryption import encrypt_token
+from app.core.time import get_now
 
 
 class CookieCompatTestClient(TestClient):
@@ -25,12 +29,12 @@ class CookieCompatTestClient(TestClient):
         return super().request(method, url, *args, **kwargs)
 
 
-# Freeze time to a consistent datetime for all tests
-# Using 2025-12-14 12:00 PM America/Chicago timezone
+# Freeze time to a consistent datetime for all tests:
+# 2025-12-14 12:00 UTC, with the local clock at UTC-6 (America/Chicago in winter)
 @pytest.fixture(scope="function", autouse=True)
 def frozen_time():
     """Freeze time to ensure consistent dates across all test environments."""
-    with freeze_time("2025-12-14 12:00:00", tz_offset=-6):  # America/Chicago is UTC-6
+    with time_machine.travel(datetime(2025, 12, 14, 6, 0, tzinfo=ZoneInfo("Etc/GMT+6")), tick=False):
         yield
 
 
@@ -42,39 +46,92 @@ def test_secret_key():
     yield
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a test database for each test."""
-    test_db_path = "/tmp/test_streaklet.db"
+@pytest.fixture(scope="session")
+def encrypted_tokens(test_secret_key):
+    """Encrypt the default access/refresh tokens once per test session."""
+    return encrypt_token("access_token"), encrypt_token("refresh_token")
+
+
+# Profiles seeded once per test session; every test sees them, and changes
+# made by a test are rolled back with the rest of its transaction.
+SAMPLE_PROFILES = (
+    {"id": 1, "name": "Test Profile 1", "color": "#3b82f6"},
+    {"id": 2, "name": "Test Profile 2", "color": "#10b981"},
+)
 
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
 
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the in-memory test database schema and seed profiles once per session."""
+    from app.models.profile import Profile
+
+    # StaticPool keeps the single in-memory connection alive for the whole
+    # session, so commits never touch disk. Each pytest-xdist worker is its own
+    # process and therefore gets its own database.
     engine = create_engine(
-        f"sqlite:///{test_db_path}",
-        connect_args={"check_same_thread": False}
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
-    # Enable foreign keys for SQLite test database
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
+        # Enable foreign keys for SQLite test database
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # Test data is throwaway: skip fsyncs and keep journals/temp tables in memory
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Profile), list(SAMPLE_PROFILES))
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """
+    Provide a session inside a transaction that is rolled back after each test.
+
+    Session.commit() only releases a SAVEPOINT, so tests and application code
+    can commit freely without leaking rows into the next test.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield session
 
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session.close()
+    transaction.rollback()
+    connection.close()
 
-    yield TestingSessionLocal()
 
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
+@pytest.fixture(scope="session")
+def shared_client():
+    """Build one test client for the session; use the client fixture in tests."""
+    return CookieCompatTestClient(app)
 
 
 @pytest.fixture(scope="function")
-def client(test_db: Session):
-    """Create a test client with dependency override."""
+def client(shared_client: TestClient, test_db: Session):
+    """Return the shared test client wired to this test's database session."""
     def override_get_db():
         try:
             yield test_db
@@ -82,26 +139,18 @@ def client(test_db: Session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-    client = CookieCompatTestClient(app)
-    yield client
+    # Cookies set by a previous test (e.g. profile_id) must not leak into this one
+    shared_client.cookies.clear()
+    yield shared_client
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
 def sample_profiles(test_db: Session):
-    """Create sample profiles for testing."""
+    """Return the two profiles seeded for the test session."""
     from app.models.profile import Profile
 
-    profiles = [
-        Profile(id=1, name="Test Profile 1", color="#3b82f6"),
-        Profile(id=2, name="Test Profile 2", color="#10b981"),
-    ]
-
-    for profile in profiles:
-        test_db.add(profile)
-    test_db.commit()
-
-    return profiles
+    return test_db.scalars(select(Profile).order_by(Profile.id)).all()
 
 
 @pytest.fixture
@@ -113,14 +162,46 @@ def sample_tasks(test_db: Session, sample_profiles):
     # Using 2024-11-01 so tasks are active for December 2024 tests
     past_date = date(2024, 11, 1)
 
-    tasks = [
-        Task(id=1, user_id=1, title="Task 1", sort_order=1, is_required=True, is_active=True, active_since=past_date),
-        Task(id=2, user_id=1, title="Task 2", sort_order=2, is_required=True, is_active=True, active_since=past_date),
-        Task(id=3, user_id=1, title="Task 3", sort_order=3, is_required=False, is_active=True, active_since=past_date),
+    rows = [
+        {"id": 1, "user_id": 1, "title": "Task 1", "sort_order": 1, "is_required": True, "is_active": True, "active_since": past_date},
+        {"id": 2, "user_id": 1, "title": "Task 2", "sort_order": 2, "is_required": True, "is_active": True, "active_since": past_date},
+        {"id": 3, "user_id": 1, "title": "Task 3", "sort_order": 3, "is_required": False, "is_active": True, "active_since": past_date},
     ]
 
-    for task in tasks:
-        test_db.add(task)
+    tasks = test_db.scalars(insert(Task).returning(Task), rows).all()
     test_db.commit()
 
     return tasks
+
+
+@pytest.fixture
+def make_connection(test_db: Session, encrypted_tokens):
+    """
+    Factory that persists a FitbitConnection for profile 1, with keyword overrides.
+
+    Pass commit=False to leave the insert uncommitted, so it is committed
+    together with whatever the test adds next.
+    """
+    from app.models.fitbit_connection import FitbitConnection
+
+    access_token, refresh_token = encrypted_tokens
+
+    def _make(commit: bool = True, **overrides):
+        now = get_now()
+        fields = {
+            "user_id": 1,
+            "fitbit_user_id": "FITBIT123",
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_expires_at": now + timedelta(hours=1),
+            "scope": "activity",
+            "connected_at": now,
+        }
+        fields.update(overrides)
+
+        connection = test_db.scalars(insert(FitbitConnection).returning(FitbitConnection), [fields]).one()
+        if commit:
+            test_db.commit()
+        return connection
+
+    return _make
@@ -299,6 +299,7 @@ async def test_fetch_cardio_fitness_invalid_value_ignored(test_db: Session, mock
         assert metrics == {}
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_fetch_all_metrics_success(test_db: Session, mock_connection):
     """Test fetching all metrics combines activity, sleep, and heart rate."""
@@ -334,6 +335,7 @@ async def test_fetch_all_metrics_success(test_db: Session, mock_connection):
                 assert metrics["resting_heart_rate"]["unit"] == "bpm"
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_fetch_all_metrics_partial_failure(test_db: Session, mock_connection):
     """Test fetching all metrics when some sources fail."""
@@ -359,6 +361,7 @@ async def test_fetch_all_metrics_partial_failure(test_db: Session, mock_connecti
                 assert "sleep_minutes" not in metrics
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_fetch_all_metrics_activity_api_error(test_db: Session, mock_connection):
     """Test fetching all metrics when activity API raises FitbitAPIError."""
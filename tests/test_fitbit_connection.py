@@ -8,17 +8,18 @@ from app.models.fitbit_connection import FitbitConnection
 from app.models.fitbit_metric import FitbitMetric
 from app.models.task import Task
 from app.core.time import get_now, get_today
-from app.core.encryption import encrypt_token
 
 
-def test_get_connection(test_db: Session, sample_profiles):
+def test_get_connection(test_db: Session, sample_profiles, encrypted_tokens):
     """Test retrieving a Fitbit connection."""
+    access_token, refresh_token = encrypted_tokens
+
     # Create connection
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity heartrate",
         connected_at=get_now()
@@ -40,14 +41,16 @@ def test_get_connection_not_exists(test_db: Session, sample_profiles):
     assert result is None
 
 
-def test_get_connection_profile_isolation(test_db: Session, sample_profiles):
+def test_get_connection_profile_isolation(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that connections are isolated by profile."""
+    access_token, refresh_token = encrypted_tokens
+
     # Create connection for profile 1
     connection1 = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT_USER1",
-        access_token=encrypt_token("token1"),
-        refresh_token=encrypt_token("refresh1"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -61,14 +64,16 @@ def test_get_connection_profile_isolation(test_db: Session, sample_profiles):
 
 
 @pytest.mark.asyncio
-async def test_delete_connection(test_db: Session, sample_profiles):
+async def test_delete_connection(test_db: Session, sample_profiles, encrypted_tokens):
     """Test deleting a Fitbit connection."""
+    access_token, refresh_token = encrypted_tokens
+
     # Create connection
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -93,15 +98,16 @@ async def test_delete_connection_not_exists(test_db: Session, sample_profiles):
 
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="CASCADE delete requires PRAGMA foreign_keys=ON before table creation in SQLite. Works in production but hard to test due to fixture timing.")
-async def test_delete_connection_cascades_to_metrics(test_db: Session, sample_profiles):
+async def test_delete_connection_cascades_to_metrics(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that deleting connection cascades to Fitbit metrics."""
+    access_token, refresh_token = encrypted_tokens
 
     # Create connection
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -139,14 +145,16 @@ async def test_delete_connection_cascades_to_metrics(test_db: Session, sample_pr
 
 
 @pytest.mark.asyncio
-async def test_delete_connection_preserves_task_auto_check(test_db: Session, sample_profiles):
+async def test_delete_connection_preserves_task_auto_check(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that deleting connection preserves fitbit_auto_check on tasks."""
+    access_token, refresh_token = encrypted_tokens
+
     # Create connection
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -182,14 +190,16 @@ async def test_delete_connection_preserves_task_auto_check(test_db: Session, sam
 
 
 @pytest.mark.asyncio
-async def test_delete_connection_does_not_affect_other_profiles(test_db: Session, sample_profiles):
+async def test_delete_connection_does_not_affect_other_profiles(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that deleting one profile's connection doesn't affect others."""
+    access_token, refresh_token = encrypted_tokens
+
     # Create connections for two profiles
     connection1 = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT_USER1",
-        access_token=encrypt_token("token1"),
-        refresh_token=encrypt_token("refresh1"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -197,8 +207,8 @@ async def test_delete_connection_does_not_affect_other_profiles(test_db: Session
     connection2 = FitbitConnection(
         user_id=2,
         fitbit_user_id="FITBIT_USER2",
-        access_token=encrypt_token("token2"),
-        refresh_token=encrypt_token("refresh2"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
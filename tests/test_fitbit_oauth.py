@@ -94,16 +94,16 @@ async def test_exchange_code_updates_existing_connection(test_db: Session, sampl
 
 
 @pytest.mark.asyncio
-async def test_refresh_access_token(test_db: Session, sample_profiles):
+async def test_refresh_access_token(test_db: Session, sample_profiles, encrypted_tokens):
     """Test refreshing an expired access token."""
-    from app.core.encryption import encrypt_token
+    access_token, refresh_token = encrypted_tokens
 
     # Create connection with expired token
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("old_access_token"),
-        refresh_token=encrypt_token("old_refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() - timedelta(hours=1),  # Expired
         scope="activity",
         connected_at=get_now()
@@ -174,16 +174,16 @@ def test_is_token_expired():
 
 
 @pytest.mark.asyncio
-async def test_ensure_valid_token_refreshes_if_expired(test_db: Session, sample_profiles):
+async def test_ensure_valid_token_refreshes_if_expired(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that ensure_valid_token refreshes expired tokens."""
-    from app.core.encryption import encrypt_token
+    access_token, refresh_token = encrypted_tokens
 
     # Create connection with expired token
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("old_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() - timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
@@ -210,15 +210,15 @@ async def test_ensure_valid_token_refreshes_if_expired(test_db: Session, sample_
 
 
 @pytest.mark.asyncio
-async def test_ensure_valid_token_does_not_refresh_valid_token(test_db: Session, sample_profiles):
+async def test_ensure_valid_token_does_not_refresh_valid_token(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that ensure_valid_token doesn't refresh valid tokens."""
-    from app.core.encryption import encrypt_token
+    access_token, refresh_token = encrypted_tokens
 
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("valid_token"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=2),
         scope="activity",
         connected_at=get_now()
@@ -235,15 +235,15 @@ async def test_ensure_valid_token_does_not_refresh_valid_token(test_db: Session,
 
 
 @pytest.mark.asyncio
-async def test_revoke_token_best_effort(test_db: Session, sample_profiles):
+async def test_revoke_token_best_effort(test_db: Session, sample_profiles, encrypted_tokens):
     """Test that token revocation is best-effort and doesn't raise errors."""
-    from app.core.encryption import encrypt_token
+    access_token, refresh_token = encrypted_tokens
 
     connection = FitbitConnection(
         user_id=1,
         fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("token_to_revoke"),
-        refresh_token=encrypt_token("refresh_token"),
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_expires_at=get_now() + timedelta(hours=1),
         scope="activity",
         connected_at=get_now()
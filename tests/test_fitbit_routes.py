@@ -1,13 +1,27 @@
 """Tests for Fitbit API routes."""
+import pytest
 from datetime import timedelta, date
-from unittest.mock import patch
+from urllib.parse import urlencode
+from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 
-from app.models.fitbit_connection import FitbitConnection
+from app.api.routes_fitbit import _issue_oauth_state
 from app.models.fitbit_metric import FitbitMetric
-from app.core.encryption import encrypt_token
 from app.core.time import get_now
 
+# Oversized OAuth error message (500 characters) used to exercise message truncation
+_LONG_ERROR = "A" * 500
+_LONG_ERROR_QUERY = urlencode({"error": _LONG_ERROR, "state": "invalid"})
+
+
+@pytest.fixture
+def mock_sync(monkeypatch):
+    """Replace sync_profile_smart with one AsyncMock; tests set return_value/side_effect."""
+    mock = AsyncMock()
+    monkeypatch.setattr("app.services.fitbit_sync.sync_profile_smart", mock)
+    return mock
+
 
 def test_get_fitbit_connect_generates_auth_url(client: TestClient, sample_profiles):
     """Test that /api/fitbit/connect returns an authorization URL."""
@@ -32,22 +46,13 @@ def test_get_fitbit_connection_status_not_connected(client: TestClient, sample_p
     assert data["last_sync_at"] is None
 
 
-def test_get_fitbit_connection_status_connected(client: TestClient, test_db, sample_profiles):
+def test_get_fitbit_connection_status_connected(client: TestClient, make_connection, sample_profiles):
     """Test connection status when connected."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
+    make_connection(
         scope="activity heartrate",
-        connected_at=get_now(),
         last_sync_at=get_now(),
-        last_sync_status="success"
+        last_sync_status="success",
     )
-    test_db.add(connection)
-    test_db.commit()
 
     response = client.get("/api/fitbit/connection")
 
@@ -58,20 +63,9 @@ def test_get_fitbit_connection_status_connected(client: TestClient, test_db, sam
     assert data["last_sync_status"] == "success"
 
 
-def test_delete_fitbit_connection(client: TestClient, test_db, sample_profiles):
+def test_delete_fitbit_connection(client: TestClient, test_db, make_connection, sample_profiles):
     """Test disconnecting Fitbit account."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection()
 
     response = client.delete("/api/fitbit/connection")
 
@@ -98,121 +92,92 @@ def test_get_fitbit_metrics_no_connection(client: TestClient, sample_profiles):
     assert "not connected" in response.json()["detail"].lower()
 
 
-def test_get_fitbit_metrics(client: TestClient, test_db, sample_profiles):
-    """Test retrieving Fitbit metrics."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create metrics
-    metric1 = FitbitMetric(
-        user_id=1,
-        date=date(2025, 1, 15),
-        metric_type="steps",
-        value=10543,
-        unit="steps"
-    )
-    metric2 = FitbitMetric(
-        user_id=1,
-        date=date(2025, 1, 15),
-        metric_type="sleep_minutes",
-        value=450,
-        unit="minutes"
-    )
-    test_db.add(metric1)
-    test_db.add(metric2)
+_JAN_15_METRICS = [
+    (date(2025, 1, 15), "steps", 10543, "steps"),
+    (date(2025, 1, 15), "sleep_minutes", 450, "minutes"),
+    (date(2025, 1, 15), "active_minutes", 35, "minutes"),
+]
+
+METRIC_CASES = [
+    pytest.param(
+        _JAN_15_METRICS[:2],
+        {"start_date": "2025-01-15", "end_date": "2025-01-15"},
+        {("steps", 10543), ("sleep_minutes", 450)},
+        id="single_day",
+    ),
+    pytest.param(
+        [
+            (date(2025, 1, 10), "steps", 8000, "steps"),
+            (date(2025, 1, 15), "steps", 10000, "steps"),
+            (date(2025, 1, 20), "steps", 12000, "steps"),
+        ],
+        {"start_date": "2025-01-15", "end_date": "2025-01-15"},
+        {("steps", 10000)},
+        id="date_filter",
+    ),
+    pytest.param(
+        _JAN_15_METRICS,
+        {"start_date": "2025-01-15", "end_date": "2025-01-15", "metric_types": "steps,sleep_minutes"},
+        {("steps", 10543), ("sleep_minutes", 450)},
+        id="type_filter",
+    ),
+]
+
+METRIC_HISTORY_CASES = [
+    pytest.param(
+        [
+            (date(2025, 1, 10), "steps", 8000, "steps"),
+            (date(2025, 1, 11), "steps", 9000, "steps"),
+            (date(2025, 1, 12), "steps", 10000, "steps"),
+            (date(2025, 1, 10), "sleep_minutes", 420, "minutes"),
+            (date(2025, 1, 11), "sleep_minutes", 450, "minutes"),
+        ],
+        {"start_date": "2025-01-10", "end_date": "2025-01-12"},
+        {
+            "steps": [("2025-01-10", 8000), ("2025-01-11", 9000), ("2025-01-12", 10000)],
+            "sleep_minutes": [("2025-01-10", 420), ("2025-01-11", 450)],
+        },
+        id="all_types",
+    ),
+    pytest.param(
+        [
+            (date(2025, 1, 10), "steps", 8000, "steps"),
+            (date(2025, 1, 10), "sleep_minutes", 420, "minutes"),
+            (date(2025, 1, 10), "active_minutes", 30, "minutes"),
+        ],
+        {"start_date": "2025-01-10", "end_date": "2025-01-10", "metric_types": "steps"},
+        {"steps": [("2025-01-10", 8000)]},
+        id="type_filter",
+    ),
+]
+
+
+def _seed_metrics(test_db, make_connection, rows):
+    """Persist a Fitbit connection plus metric rows for profile 1 in one commit."""
+    make_connection(commit=False)
+    test_db.execute(insert(FitbitMetric), [
+        {"user_id": 1, "date": metric_date, "metric_type": metric_type, "value": value, "unit": unit}
+        for metric_date, metric_type, value, unit in rows
+    ])
     test_db.commit()
 
-    response = client.get("/api/fitbit/metrics?start_date=2025-01-15&end_date=2025-01-15")
 
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 2
-    assert any(m["metric_type"] == "steps" and m["value"] == 10543 for m in data)
-    assert any(m["metric_type"] == "sleep_minutes" and m["value"] == 450 for m in data)
-
-
-def test_get_fitbit_metrics_filters_by_date(client: TestClient, test_db, sample_profiles):
-    """Test that metrics are filtered by date range."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create metrics for different dates
-    metric1 = FitbitMetric(
-        user_id=1,
-        date=date(2025, 1, 10),
-        metric_type="steps",
-        value=8000,
-        unit="steps"
-    )
-    metric2 = FitbitMetric(
-        user_id=1,
-        date=date(2025, 1, 15),
-        metric_type="steps",
-        value=10000,
-        unit="steps"
-    )
-    metric3 = FitbitMetric(
-        user_id=1,
-        date=date(2025, 1, 20),
-        metric_type="steps",
-        value=12000,
-        unit="steps"
-    )
-    test_db.add_all([metric1, metric2, metric3])
-    test_db.commit()
+@pytest.mark.parametrize("seed,params,expected", METRIC_CASES)
+def test_get_fitbit_metrics(client: TestClient, test_db, make_connection, sample_profiles, seed, params, expected):
+    """Test retrieving Fitbit metrics with date and type filters."""
+    _seed_metrics(test_db, make_connection, seed)
 
-    # Query for Jan 15 only
-    response = client.get("/api/fitbit/metrics?start_date=2025-01-15&end_date=2025-01-15")
+    response = client.get("/api/fitbit/metrics", params=params)
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 1
-    assert data[0]["value"] == 10000
+    assert len(data) == len(expected)
+    assert {(m["metric_type"], m["value"]) for m in data} == expected
 
 
-def test_get_fitbit_daily_summary(client: TestClient, test_db, sample_profiles):
+def test_get_fitbit_daily_summary(client: TestClient, test_db, make_connection, sample_profiles):
     """Test getting daily summary of all metrics."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create multiple metrics for the same day
-    metrics = [
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="steps", value=10543, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="sleep_minutes", value=450, unit="minutes"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="active_minutes", value=35, unit="minutes"),
-    ]
-    test_db.add_all(metrics)
-    test_db.commit()
+    _seed_metrics(test_db, make_connection, _JAN_15_METRICS)
 
     response = client.get("/api/fitbit/daily-summary?date=2025-01-15")
 
@@ -228,20 +193,9 @@ def test_get_fitbit_daily_summary(client: TestClient, test_db, sample_profiles):
     assert data["metrics"]["active_minutes"]["unit"] == "minutes"
 
 
-def test_get_fitbit_daily_summary_no_data(client: TestClient, test_db, sample_profiles):
+def test_get_fitbit_daily_summary_no_data(client: TestClient, make_connection, sample_profiles):
     """Test daily summary when no data exists."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection()
 
     response = client.get("/api/fitbit/daily-summary?date=2025-01-15")
 
@@ -251,32 +205,20 @@ def test_get_fitbit_daily_summary_no_data(client: TestClient, test_db, sample_pr
     assert data["metrics"] == {}
 
 
-def test_post_fitbit_sync_triggers_sync(client: TestClient, test_db, sample_profiles):
+def test_post_fitbit_sync_triggers_sync(client: TestClient, make_connection, sample_profiles, mock_sync):
     """Test manual sync trigger."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=8),
-        scope="activity heartrate sleep",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection(token_expires_at=get_now() + timedelta(hours=8), scope="activity heartrate sleep")
 
-    # Mock the sync service
-    with patch("app.services.fitbit_sync.sync_profile_smart") as mock_sync:
-        mock_sync.return_value = {"success_days": 2, "error_days": 0, "total_metrics": 12}
+    mock_sync.return_value = {"success_days": 2, "error_days": 0, "total_metrics": 12}
 
-        response = client.post("/api/fitbit/sync")
+    response = client.post("/api/fitbit/sync")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert "sync completed" in data["message"].lower()
-        assert data["details"]["total_metrics"] == 12
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    assert "sync completed" in data["message"].lower()
+    assert data["details"]["total_metrics"] == 12
+    mock_sync.assert_awaited_once()
 
 
 def test_post_fitbit_sync_not_connected(client: TestClient, sample_profiles):
@@ -287,40 +229,24 @@ def test_post_fitbit_sync_not_connected(client: TestClient, sample_profiles):
     assert "not connected" in response.json()["detail"].lower()
 
 
-def test_fitbit_routes_respect_profile_header(client: TestClient, test_db, sample_profiles):
+@pytest.mark.parametrize(
+    "profile_id,other_profile_id,fitbit_user_id",
+    [(1, 2, "FITBIT_USER1"), (2, 1, "FITBIT_USER2")],
+)
+def test_fitbit_routes_respect_profile_header(
+    client: TestClient, make_connection, sample_profiles, profile_id, other_profile_id, fitbit_user_id
+):
     """Test that Fitbit routes respect profile_id cookie."""
-    # Create connections for two profiles
-    connection1 = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT_USER1",
-        access_token=encrypt_token("token1"),
-        refresh_token=encrypt_token("refresh1"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    connection2 = FitbitConnection(
-        user_id=2,
-        fitbit_user_id="FITBIT_USER2",
-        access_token=encrypt_token("token2"),
-        refresh_token=encrypt_token("refresh2"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection1)
-    test_db.add(connection2)
-    test_db.commit()
+    make_connection(user_id=profile_id, fitbit_user_id=fitbit_user_id)
 
-    # Request for profile 1
-    response1 = client.get("/api/fitbit/connection", cookies={"profile_id": "1"})
-    assert response1.status_code == 200
-    assert response1.json()["fitbit_user_id"] == "FITBIT_USER1"
+    response = client.get("/api/fitbit/connection", cookies={"profile_id": str(profile_id)})
+    assert response.status_code == 200
+    assert response.json()["fitbit_user_id"] == fitbit_user_id
 
-    # Request for profile 2
-    response2 = client.get("/api/fitbit/connection", cookies={"profile_id": "2"})
-    assert response2.status_code == 200
-    assert response2.json()["fitbit_user_id"] == "FITBIT_USER2"
+    # The other profile must not see this connection
+    response = client.get("/api/fitbit/connection", cookies={"profile_id": str(other_profile_id)})
+    assert response.status_code == 200
+    assert response.json()["connected"] is False
 
 
 def test_oauth_callback_with_error(client: TestClient, sample_profiles):
@@ -368,94 +294,67 @@ def test_oauth_callback_invalid_state(client: TestClient, sample_profiles):
     assert "/settings?fitbit=error&message=invalid_state" in response.headers["location"]
 
 
-def test_oauth_callback_success(client: TestClient, sample_profiles):
+def test_oauth_callback_success(client: TestClient, sample_profiles, monkeypatch):
     """Test successful OAuth callback flow."""
-    # First, initiate connection to get valid state
-    init_response = client.get("/api/fitbit/connect")
-    state = init_response.json()["state"]
+    state = _issue_oauth_state(profile_id=1)
 
     # Mock successful token exchange
-    with patch("app.services.fitbit_oauth.exchange_code_for_tokens") as mock_exchange:
-        mock_exchange.return_value = None
+    monkeypatch.setattr("app.services.fitbit_oauth.exchange_code_for_tokens", AsyncMock(return_value=None))
 
-        response = client.get(f"/api/fitbit/callback?code=test_auth_code&state={state}", follow_redirects=False)
+    response = client.get(f"/api/fitbit/callback?code=test_auth_code&state={state}", follow_redirects=False)
 
-        assert response.status_code == 307
-        assert response.headers["location"] == "/settings?fitbit=connected"
+    assert response.status_code == 307
+    assert response.headers["location"] == "/settings?fitbit=connected"
 
 
-def test_oauth_callback_exchange_failure(client: TestClient, sample_profiles):
+def test_oauth_callback_exchange_failure(client: TestClient, sample_profiles, monkeypatch):
     """Test OAuth callback when token exchange fails."""
-    # First, initiate connection to get valid state
-    init_response = client.get("/api/fitbit/connect")
-    state = init_response.json()["state"]
+    state = _issue_oauth_state(profile_id=1)
 
     # Mock token exchange to raise exception
-    with patch("app.services.fitbit_oauth.exchange_code_for_tokens") as mock_exchange:
-        mock_exchange.side_effect = Exception("Token exchange failed")
+    monkeypatch.setattr(
+        "app.services.fitbit_oauth.exchange_code_for_tokens",
+        AsyncMock(side_effect=Exception("Token exchange failed")),
+    )
 
-        response = client.get(f"/api/fitbit/callback?code=test_code&state={state}", follow_redirects=False)
+    response = client.get(f"/api/fitbit/callback?code=test_code&state={state}", follow_redirects=False)
 
-        assert response.status_code == 307
-        location = response.headers["location"]
-        assert "/settings?fitbit=error&message=" in location
-        # URL-encoded version of "Token exchange failed"
-        assert "Token" in location and "exchange" in location and "failed" in location
+    assert response.status_code == 307
+    location = response.headers["location"]
+    assert "/settings?fitbit=error&message=" in location
+    # URL-encoded version of "Token exchange failed"
+    assert "Token" in location and "exchange" in location and "failed" in location
 
 
-def test_manual_sync_failure(client: TestClient, test_db, sample_profiles):
+def test_manual_sync_failure(client: TestClient, make_connection, sample_profiles, mock_sync):
     """Test manual sync when sync service fails."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=8),
-        scope="activity heartrate sleep",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection(token_expires_at=get_now() + timedelta(hours=8), scope="activity heartrate sleep")
 
-    # Mock sync to fail
-    with patch("app.services.fitbit_sync.sync_profile_smart") as mock_sync:
-        mock_sync.side_effect = Exception("Sync service failed")
+    mock_sync.side_effect = Exception("Sync service failed")
 
-        response = client.post("/api/fitbit/sync")
+    response = client.post("/api/fitbit/sync")
 
-        assert response.status_code == 500
-        assert "Sync failed" in response.json()["detail"]
-        assert "Sync service failed" in response.json()["detail"]
+    assert response.status_code == 500
+    assert "Sync failed" in response.json()["detail"]
+    assert "Sync service failed" in response.json()["detail"]
 
 
-def test_manual_sync_returns_502_when_no_days_succeed(client: TestClient, test_db, sample_profiles):
+def test_manual_sync_returns_502_when_no_days_succeed(client: TestClient, make_connection, sample_profiles, mock_sync):
     """Test manual sync returns 502 when every requested day fails."""
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=8),
-        scope="activity heartrate sleep",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection(token_expires_at=get_now() + timedelta(hours=8), scope="activity heartrate sleep")
 
-    with patch("app.services.fitbit_sync.sync_profile_smart") as mock_sync:
-        mock_sync.return_value = {
-            "success_days": 0,
-            "error_days": 2,
-            "total_metrics": 0,
-            "errors": [{"date": "2025-12-14", "error": "Unauthorized after token refresh; reconnect Fitbit"}]
-        }
+    mock_sync.return_value = {
+        "success_days": 0,
+        "error_days": 2,
+        "total_metrics": 0,
+        "errors": [{"date": "2025-12-14", "error": "Unauthorized after token refresh; reconnect Fitbit"}]
+    }
 
-        response = client.post("/api/fitbit/sync")
+    response = client.post("/api/fitbit/sync")
 
-        assert response.status_code == 502
-        detail = response.json()["detail"]
-        assert "no data updated" in detail.lower()
+    assert response.status_code == 502
+    detail = response.json()["detail"]
+    assert "no data updated" in detail.lower()
 
 
 def test_get_sync_status_not_connected(client: TestClient, sample_profiles):
@@ -466,21 +365,9 @@ def test_get_sync_status_not_connected(client: TestClient, sample_profiles):
     assert "not connected" in response.json()["detail"].lower()
 
 
-def test_get_sync_status_success(client: TestClient, test_db, sample_profiles):
+def test_get_sync_status_success(client: TestClient, make_connection, sample_profiles):
     """Test getting sync status when connected."""
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now(),
-        last_sync_at=get_now(),
-        last_sync_status="success"
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection(last_sync_at=get_now(), last_sync_status="success")
 
     response = client.get("/api/fitbit/sync-status")
 
@@ -491,41 +378,6 @@ def test_get_sync_status_success(client: TestClient, test_db, sample_profiles):
     assert data["last_sync_at"] is not None
 
 
-def test_get_metrics_with_type_filter(client: TestClient, test_db, sample_profiles):
-    """Test retrieving metrics filtered by type."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create multiple metric types
-    metrics = [
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="steps", value=10543, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="sleep_minutes", value=450, unit="minutes"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 15), metric_type="active_minutes", value=35, unit="minutes"),
-    ]
-    test_db.add_all(metrics)
-    test_db.commit()
-
-    # Filter for only steps and sleep
-    response = client.get("/api/fitbit/metrics?start_date=2025-01-15&end_date=2025-01-15&metric_types=steps,sleep_minutes")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 2
-    assert any(m["metric_type"] == "steps" for m in data)
-    assert any(m["metric_type"] == "sleep_minutes" for m in data)
-    assert not any(m["metric_type"] == "active_minutes" for m in data)
-
-
 def test_get_daily_summary_not_connected(client: TestClient, sample_profiles):
     """Test getting daily summary when not connected returns 404."""
     response = client.get("/api/fitbit/daily-summary?date=2025-01-15")
@@ -534,79 +386,21 @@ def test_get_daily_summary_not_connected(client: TestClient, sample_profiles):
     assert "not connected" in response.json()["detail"].lower()
 
 
-def test_get_metrics_history(client: TestClient, test_db, sample_profiles):
-    """Test getting historical metrics data."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create metrics for multiple dates
-    metrics = [
-        FitbitMetric(user_id=1, date=date(2025, 1, 10), metric_type="steps", value=8000, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 11), metric_type="steps", value=9000, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 12), metric_type="steps", value=10000, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 10), metric_type="sleep_minutes", value=420, unit="minutes"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 11), metric_type="sleep_minutes", value=450, unit="minutes"),
-    ]
-    test_db.add_all(metrics)
-    test_db.commit()
-
-    response = client.get("/api/fitbit/metrics/history?start_date=2025-01-10&end_date=2025-01-12")
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["start_date"] == "2025-01-10"
-    assert data["end_date"] == "2025-01-12"
-    assert "metrics" in data
-    assert "steps" in data["metrics"]
-    assert "sleep_minutes" in data["metrics"]
-    assert len(data["metrics"]["steps"]) == 3
-    assert len(data["metrics"]["sleep_minutes"]) == 2
-    assert data["metrics"]["steps"][0]["date"] == "2025-01-10"
-    assert data["metrics"]["steps"][0]["value"] == 8000
-
-
-def test_get_metrics_history_with_type_filter(client: TestClient, test_db, sample_profiles):
-    """Test getting historical metrics filtered by type."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
-
-    # Create metrics for multiple dates and types
-    metrics = [
-        FitbitMetric(user_id=1, date=date(2025, 1, 10), metric_type="steps", value=8000, unit="steps"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 10), metric_type="sleep_minutes", value=420, unit="minutes"),
-        FitbitMetric(user_id=1, date=date(2025, 1, 10), metric_type="active_minutes", value=30, unit="minutes"),
-    ]
-    test_db.add_all(metrics)
-    test_db.commit()
+@pytest.mark.parametrize("seed,params,expected", METRIC_HISTORY_CASES)
+def test_get_metrics_history(client: TestClient, test_db, make_connection, sample_profiles, seed, params, expected):
+    """Test getting historical metrics grouped by type, with optional type filter."""
+    _seed_metrics(test_db, make_connection, seed)
 
-    response = client.get("/api/fitbit/metrics/history?start_date=2025-01-10&end_date=2025-01-10&metric_types=steps")
+    response = client.get("/api/fitbit/metrics/history", params=params)
 
     assert response.status_code == 200
     data = response.json()
-    assert "steps" in data["metrics"]
-    assert "sleep_minutes" not in data["metrics"]
-    assert "active_minutes" not in data["metrics"]
-    assert len(data["metrics"]["steps"]) == 1
+    assert data["start_date"] == params["start_date"]
+    assert data["end_date"] == params["end_date"]
+    assert {
+        metric_type: [(point["date"], point["value"]) for point in points]
+        for metric_type, points in data["metrics"].items()
+    } == expected
 
 
 def test_get_metrics_history_not_connected(client: TestClient, sample_profiles):
@@ -638,9 +432,7 @@ def test_safe_settings_redirect_sanitizes_user_input(client: TestClient, sample_
 
 def test_safe_settings_redirect_limits_message_length(client: TestClient, sample_profiles):
     """Test that error messages are truncated to prevent abuse."""
-    # Create a very long error message
-    long_error = "A" * 500  # 500 characters
-    response = client.get(f"/api/fitbit/callback?error={long_error}&state=invalid", follow_redirects=False)
+    response = client.get(f"/api/fitbit/callback?{_LONG_ERROR_QUERY}", follow_redirects=False)
 
     assert response.status_code == 307
     location = response.headers["location"]
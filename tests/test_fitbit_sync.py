@@ -1,14 +1,46 @@
 """Tests for Fitbit sync service."""
+import asyncio
 import pytest
 from datetime import date, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.models.fitbit_connection import FitbitConnection
 from app.models.fitbit_metric import FitbitMetric
-from app.core.encryption import encrypt_token
+from app.core.config import settings
 from app.core.time import get_now
-from app.services import fitbit_sync
+from app.services import fitbit_api, fitbit_sync
+
+
+def _insert_two_connections(test_db: Session, encrypted_tokens):
+    """Insert Fitbit connections for profiles 1 and 2 in one statement."""
+    access_token, refresh_token = encrypted_tokens
+    now = get_now()
+    rows = [
+        {
+            "user_id": profile_id,
+            "fitbit_user_id": f"FITBIT{profile_id}",
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_expires_at": now + timedelta(hours=1),
+            "scope": "activity",
+            "connected_at": now,
+            "last_sync_at": now,
+        }
+        for profile_id in (1, 2)
+    ]
+    connections = test_db.scalars(insert(FitbitConnection).returning(FitbitConnection), rows).all()
+    test_db.commit()
+    return connections
+
+
+@pytest.fixture
+def mock_fetch(monkeypatch):
+    """Replace fitbit_api.fetch_all_metrics with one AsyncMock; tests set return_value/side_effect."""
+    mock = AsyncMock(spec=fitbit_api.fetch_all_metrics)
+    monkeypatch.setattr("app.services.fitbit_api.fetch_all_metrics", mock)
+    return mock
 
 
 @pytest.mark.asyncio
@@ -25,14 +57,14 @@ async def test_upsert_metrics_creates_new(test_db: Session, sample_profiles):
     assert count == 2
 
     # Verify metrics were created
-    db_metrics = test_db.query(FitbitMetric).filter(
-        FitbitMetric.user_id == 1,
-        FitbitMetric.date == target_date
+    rows = test_db.execute(
+        select(FitbitMetric.metric_type, FitbitMetric.value).where(
+            FitbitMetric.user_id == 1,
+            FitbitMetric.date == target_date
+        )
     ).all()
 
-    assert len(db_metrics) == 2
-    assert any(m.metric_type == "steps" and m.value == 10543 for m in db_metrics)
-    assert any(m.metric_type == "sleep_minutes" and m.value == 450 for m in db_metrics)
+    assert sorted(rows) == [("sleep_minutes", 450), ("steps", 10543)]
 
 
 @pytest.mark.asyncio
@@ -51,23 +83,29 @@ async def test_upsert_metrics_updates_existing(test_db: Session, sample_profiles
     test_db.add(existing)
     test_db.commit()
 
-    # Upsert with new value
+    # Upsert with new value alongside a new metric
     metrics = {
-        "steps": {"value": 10543, "unit": "steps"}
+        "steps": {"value": 10543, "unit": "steps"},
+        "sleep_minutes": {"value": 450, "unit": "minutes"}
     }
 
-    count = await fitbit_sync.upsert_metrics(test_db, profile_id=1, target_date=target_date, metrics=metrics)
+    with patch.object(test_db, "execute", wraps=test_db.execute) as spy_execute:
+        count = await fitbit_sync.upsert_metrics(test_db, profile_id=1, target_date=target_date, metrics=metrics)
 
-    assert count == 1
+    assert count == 2
+    # Both rows go through one INSERT ... ON CONFLICT statement
+    assert spy_execute.call_count == 1
 
     # Verify metric was updated
-    db_metric = test_db.query(FitbitMetric).filter(
-        FitbitMetric.user_id == 1,
-        FitbitMetric.date == target_date,
-        FitbitMetric.metric_type == "steps"
-    ).one()
+    steps_value = test_db.scalar(
+        select(FitbitMetric.value).where(
+            FitbitMetric.user_id == 1,
+            FitbitMetric.date == target_date,
+            FitbitMetric.metric_type == "steps"
+        )
+    )
 
-    assert db_metric.value == 10543
+    assert steps_value == 10543
 
 
 @pytest.mark.asyncio
@@ -85,57 +123,34 @@ async def test_sync_profile_date_range_no_connection(test_db: Session, sample_pr
 
 
 @pytest.mark.asyncio
-async def test_sync_profile_date_range_success(test_db: Session, sample_profiles):
+async def test_sync_profile_date_range_success(test_db: Session, sample_profiles, mock_fetch, make_connection):
     """Test successful date range sync."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    connection = make_connection()
 
     start_date = date(2025, 1, 10)
     end_date = date(2025, 1, 12)
 
     # Mock fetch_all_metrics
-    with patch("app.services.fitbit_api.fetch_all_metrics") as mock_fetch:
-        mock_fetch.return_value = {
-            "steps": {"value": 10000, "unit": "steps"}
-        }
+    mock_fetch.return_value = {
+        "steps": {"value": 10000, "unit": "steps"}
+    }
 
-        result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
+    result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
 
-        assert result["success_days"] == 3
-        assert result["error_days"] == 0
-        assert result["total_metrics"] == 3
+    assert result["success_days"] == 3
+    assert result["error_days"] == 0
+    assert result["total_metrics"] == 3
 
-        # Verify connection status was updated
-        test_db.refresh(connection)
-        assert connection.last_sync_at is not None
-        assert connection.last_sync_status == "success"
+    # Verify connection status was updated
+    test_db.refresh(connection)
+    assert connection.last_sync_at is not None
+    assert connection.last_sync_status == "success"
 
 
 @pytest.mark.asyncio
-async def test_sync_profile_date_range_partial_failure(test_db: Session, sample_profiles):
+async def test_sync_profile_date_range_partial_failure(test_db: Session, sample_profiles, mock_fetch, make_connection):
     """Test date range sync with some failures."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    connection = make_connection()
 
     start_date = date(2025, 1, 10)
     end_date = date(2025, 1, 12)
@@ -150,174 +165,199 @@ async def test_sync_profile_date_range_partial_failure(test_db: Session, sample_
             raise Exception("API error")
         return {"steps": {"value": 10000, "unit": "steps"}}
 
-    with patch("app.services.fitbit_api.fetch_all_metrics", side_effect=mock_fetch_side_effect):
-        result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
+    mock_fetch.side_effect = mock_fetch_side_effect
+    result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
 
-        assert result["success_days"] == 2
-        assert result["error_days"] == 1
-        assert result["total_metrics"] == 2
+    assert result["success_days"] == 2
+    assert result["error_days"] == 1
+    assert result["total_metrics"] == 2
 
-        # Verify connection status shows partial
-        test_db.refresh(connection)
-        assert connection.last_sync_status == "partial"
+    # Verify connection status shows partial
+    test_db.refresh(connection)
+    assert connection.last_sync_status == "partial"
 
 
 @pytest.mark.asyncio
-async def test_sync_profile_date_range_no_data(test_db: Session, sample_profiles):
-    """Test syncing when no data is available."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
+async def test_sync_profile_date_range_fetches_dates_concurrently(test_db: Session, sample_profiles, mock_fetch, make_connection):
+    """Test that dates in the range are fetched concurrently."""
+    make_connection()
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_fetch_side_effect(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"steps": {"value": 10000, "unit": "steps"}}
+
+    mock_fetch.side_effect = mock_fetch_side_effect
+    result = await fitbit_sync.sync_profile_date_range(
+        test_db, profile_id=1, start_date=date(2025, 1, 10), end_date=date(2025, 1, 12)
     )
-    test_db.add(connection)
-    test_db.commit()
+
+    assert result["success_days"] == 3
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_profile_date_range_respects_concurrency_limit(
+    test_db: Session, sample_profiles, mock_fetch, make_connection, monkeypatch
+):
+    """Test that no more than fitbit_max_concurrency dates are fetched at once."""
+    make_connection()
+    monkeypatch.setattr(settings, "fitbit_max_concurrency", 2)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_fetch_side_effect(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"steps": {"value": 10000, "unit": "steps"}}
+
+    mock_fetch.side_effect = mock_fetch_side_effect
+    result = await fitbit_sync.sync_profile_date_range(
+        test_db, profile_id=1, start_date=date(2025, 1, 10), end_date=date(2025, 1, 15)
+    )
+
+    assert result["success_days"] == 6
+    assert max_in_flight == settings.fitbit_max_concurrency
+
+
+@pytest.mark.asyncio
+async def test_sync_profile_date_range_token_refresh_failure(test_db: Session, sample_profiles, mock_fetch, make_connection):
+    """Test that a failed token refresh marks every date as an error without fetching."""
+    connection = make_connection()
+
+    with patch(
+        "app.services.fitbit_oauth.ensure_valid_token",
+        new_callable=AsyncMock,
+        side_effect=Exception("invalid_grant"),
+    ):
+        result = await fitbit_sync.sync_profile_date_range(
+            test_db, profile_id=1, start_date=date(2025, 1, 10), end_date=date(2025, 1, 12)
+        )
+
+    mock_fetch.assert_not_awaited()
+    assert result["success_days"] == 0
+    assert result["error_days"] == 3
+    assert result["total_metrics"] == 0
+    assert [error["date"] for error in result["errors"]] == ["2025-01-10", "2025-01-11", "2025-01-12"]
+
+    test_db.refresh(connection)
+    assert connection.last_sync_status == "error"
+
+
+@pytest.mark.asyncio
+async def test_sync_profile_date_range_auto_check_failure(test_db: Session, sample_profiles, mock_fetch, make_connection):
+    """Test that a failed auto-check evaluation counts as an error day."""
+    connection = make_connection()
+    mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
+
+    async def mock_auto_checks(db, profile_id, target_date):
+        if target_date == date(2025, 1, 11):
+            raise Exception("auto-check error")
+
+    with patch("app.services.fitbit_sync.evaluate_and_apply_auto_checks", side_effect=mock_auto_checks):
+        result = await fitbit_sync.sync_profile_date_range(
+            test_db, profile_id=1, start_date=date(2025, 1, 10), end_date=date(2025, 1, 12)
+        )
+
+    assert result["success_days"] == 3
+    assert result["error_days"] == 1
+    assert result["total_metrics"] == 3
+    assert result["errors"] == [{"date": "2025-01-11", "error": "auto-check error"}]
+
+    test_db.refresh(connection)
+    assert connection.last_sync_status == "partial"
+
+
+@pytest.mark.asyncio
+async def test_sync_profile_date_range_no_data(test_db: Session, sample_profiles, mock_fetch, make_connection):
+    """Test syncing when no data is available."""
+    connection = make_connection()
 
     start_date = date(2025, 1, 10)
     end_date = date(2025, 1, 12)
 
     # Mock fetch to return None (no data)
-    with patch("app.services.fitbit_api.fetch_all_metrics") as mock_fetch:
-        mock_fetch.return_value = None
+    mock_fetch.return_value = None
 
-        result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
+    result = await fitbit_sync.sync_profile_date_range(test_db, profile_id=1, start_date=start_date, end_date=end_date)
 
-        assert result["success_days"] == 0
-        assert result["error_days"] == 3
-        assert result["total_metrics"] == 0
-        assert "errors" in result
+    assert result["success_days"] == 0
+    assert result["error_days"] == 3
+    assert result["total_metrics"] == 0
+    assert "errors" in result
 
-        test_db.refresh(connection)
-        assert connection.last_sync_status == "error"
+    test_db.refresh(connection)
+    assert connection.last_sync_status == "error"
 
 
 @pytest.mark.asyncio
-async def test_sync_profile_recent(test_db: Session, sample_profiles):
+async def test_sync_profile_recent(test_db: Session, sample_profiles, mock_fetch, make_connection):
     """Test syncing recent data (today + yesterday)."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection()
 
     # Mock fetch_all_metrics
-    with patch("app.services.fitbit_api.fetch_all_metrics") as mock_fetch:
-        mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
+    mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
 
-        result = await fitbit_sync.sync_profile_recent(test_db, profile_id=1)
+    result = await fitbit_sync.sync_profile_recent(test_db, profile_id=1)
 
-        assert result["success_days"] == 2  # Today + yesterday
-        assert result["error_days"] == 0
-        assert result["total_metrics"] == 2
+    assert result["success_days"] == 2  # Today + yesterday
+    assert result["error_days"] == 0
+    assert result["total_metrics"] == 2
 
 
 @pytest.mark.asyncio
-async def test_sync_profile_historical(test_db: Session, sample_profiles):
+async def test_sync_profile_historical(test_db: Session, sample_profiles, mock_fetch, make_connection):
     """Test syncing historical data."""
-    # Create connection
-    connection = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT123",
-        access_token=encrypt_token("access_token"),
-        refresh_token=encrypt_token("refresh_token"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now()
-    )
-    test_db.add(connection)
-    test_db.commit()
+    make_connection()
 
     # Mock fetch_all_metrics
-    with patch("app.services.fitbit_api.fetch_all_metrics") as mock_fetch:
-        mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
+    mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
 
+    with patch.object(fitbit_sync, "upsert_metrics_for_dates", wraps=fitbit_sync.upsert_metrics_for_dates) as spy_upsert:
         result = await fitbit_sync.sync_profile_historical(test_db, profile_id=1, days=7)
 
         assert result["success_days"] == 7
         assert result["error_days"] == 0
         assert result["total_metrics"] == 7
 
+        # All seven days are stored with a single batched upsert
+        spy_upsert.assert_awaited_once()
+        assert len(spy_upsert.call_args.args[2]) == 7
+
 
 @pytest.mark.asyncio
-async def test_sync_all_connected_profiles(test_db: Session, sample_profiles):
+async def test_sync_all_connected_profiles(test_db: Session, sample_profiles, mock_fetch, encrypted_tokens):
     """Test syncing all connected profiles."""
     # Create connections for two profiles
-    connection1 = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT1",
-        access_token=encrypt_token("token1"),
-        refresh_token=encrypt_token("refresh1"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now(),
-        last_sync_at=get_now()
-    )
-    connection2 = FitbitConnection(
-        user_id=2,
-        fitbit_user_id="FITBIT2",
-        access_token=encrypt_token("token2"),
-        refresh_token=encrypt_token("refresh2"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now(),
-        last_sync_at=get_now()
-    )
-    test_db.add(connection1)
-    test_db.add(connection2)
-    test_db.commit()
+    _insert_two_connections(test_db, encrypted_tokens)
 
     # Mock fetch_all_metrics
-    with patch("app.services.fitbit_api.fetch_all_metrics") as mock_fetch:
-        mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
+    mock_fetch.return_value = {"steps": {"value": 10000, "unit": "steps"}}
 
-        results = await fitbit_sync.sync_all_connected_profiles(test_db)
+    results = await fitbit_sync.sync_all_connected_profiles(test_db)
 
-        assert len(results) == 2
-        assert 1 in results
-        assert 2 in results
-        assert results[1]["success_days"] == 2
-        assert results[2]["success_days"] == 2
+    assert len(results) == 2
+    assert 1 in results
+    assert 2 in results
+    assert results[1]["success_days"] == 2
+    assert results[2]["success_days"] == 2
 
 
 @pytest.mark.asyncio
-async def test_sync_all_connected_profiles_with_failure(test_db: Session, sample_profiles):
+async def test_sync_all_connected_profiles_with_failure(test_db: Session, sample_profiles, encrypted_tokens):
     """Test syncing all profiles when one fails."""
     # Create connections for two profiles
-    connection1 = FitbitConnection(
-        user_id=1,
-        fitbit_user_id="FITBIT1",
-        access_token=encrypt_token("token1"),
-        refresh_token=encrypt_token("refresh1"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now(),
-        last_sync_at=get_now()
-    )
-    connection2 = FitbitConnection(
-        user_id=2,
-        fitbit_user_id="FITBIT2",
-        access_token=encrypt_token("token2"),
-        refresh_token=encrypt_token("refresh2"),
-        token_expires_at=get_now() + timedelta(hours=1),
-        scope="activity",
-        connected_at=get_now(),
-        last_sync_at=get_now()
-    )
-    test_db.add(connection1)
-    test_db.add(connection2)
-    test_db.commit()
+    connection1, _ = _insert_two_connections(test_db, encrypted_tokens)
 
     # Mock sync_profile_smart to fail for profile 1 at top level
     async def mock_sync_side_effect(db, profile_id, backfill_days=7):
@@ -325,7 +365,7 @@ async def test_sync_all_connected_profiles_with_failure(test_db: Session, sample
             raise Exception("API error for profile 1")
         return {"success_days": 2, "error_days": 0, "total_metrics": 2}
 
-    with patch("app.services.fitbit_sync.sync_profile_smart", side_effect=mock_sync_side_effect):
+    with patch("app.services.fitbit_sync.sync_profile_smart", new_callable=AsyncMock, side_effect=mock_sync_side_effect):
         results = await fitbit_sync.sync_all_connected_profiles(test_db)
 
         assert len(results) == 2
@@ -336,3 +376,34 @@ async def test_sync_all_connected_profiles_with_failure(test_db: Session, sample
         # Verify connection1 status shows error
         test_db.refresh(connection1)
         assert connection1.last_sync_status == "error"
+
+
+@pytest.mark.asyncio
+async def test_sync_all_connected_profiles_shares_concurrency_limit(
+    test_db: Session, sample_profiles, mock_fetch, encrypted_tokens, monkeypatch
+):
+    """Test that profiles sync one at a time, so one limit bounds every fetch in the sync."""
+    _insert_two_connections(test_db, encrypted_tokens)
+    monkeypatch.setattr(settings, "fitbit_max_concurrency", 3)
+
+    in_flight: list[int] = []
+    max_in_flight = 0
+    overlapping_profiles = False
+
+    async def mock_fetch_side_effect(db, connection, target_date):
+        nonlocal max_in_flight, overlapping_profiles
+        in_flight.append(connection.user_id)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        overlapping_profiles = overlapping_profiles or len(set(in_flight)) > 1
+        await asyncio.sleep(0)
+        in_flight.remove(connection.user_id)
+        return {"steps": {"value": 10000, "unit": "steps"}}
+
+    mock_fetch.side_effect = mock_fetch_side_effect
+    results = await fitbit_sync.sync_all_connected_profiles(test_db)
+
+    assert results[1]["success_days"] == 2
+    assert results[2]["success_days"] == 2
+    # Each profile's two dates are fetched together, but never alongside the other profile's
+    assert max_in_flight == 2
+    assert not overlapping_profiles
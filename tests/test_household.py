@@ -9,8 +9,9 @@ Key test scenarios:
 5. API endpoints work without X-Profile-Id header (except completion)
 """
 import pytest
-from datetime import date
-from freezegun import freeze_time
+from types import SimpleNamespace
+from datetime import date, datetime, timedelta
+from sqlalchemy import delete, insert, select
 
 from app.models.household_task import HouseholdTask
 from app.models.household_completion import HouseholdCompletion
@@ -18,55 +19,50 @@ from app.services import household as household_service
 
 
 @pytest.fixture
-def sample_household_tasks(test_db, sample_profiles):
-    """Create sample household tasks (shared across all profiles)."""
-    tasks = [
-        HouseholdTask(
-            id=1,
-            title="Take out trash",
-            description="Take trash and recycling bins to curb",
-            frequency="weekly",
-            sort_order=1,
-            is_active=True
-        ),
-        HouseholdTask(
-            id=2,
-            title="Replace HVAC filter",
-            description="Replace air conditioning/heating filter",
-            frequency="monthly",
-            sort_order=2,
-            is_active=True
-        ),
-        HouseholdTask(
-            id=3,
-            title="Clean gutters",
-            description="Remove leaves and debris from gutters",
-            frequency="quarterly",
-            sort_order=3,
-            is_active=True
-        ),
-        HouseholdTask(
-            id=4,
-            title="Test sump pump",
-            description="Test sump pump operation",
-            frequency="annual",
-            sort_order=4,
-            is_active=True
-        ),
-        HouseholdTask(
-            id=5,
-            title="Inactive task",
-            frequency="weekly",
-            sort_order=5,
-            is_active=False
-        ),
-    ]
-
-    for task in tasks:
+def now(monkeypatch):
+    """Pin the household service clock: call now(datetime(...)) in the test."""
+    def _set(current: datetime):
+        monkeypatch.setattr(household_service, "get_now", lambda: current)
+        monkeypatch.setattr(household_service, "get_today", lambda: current.date())
+    return _set
+
+
+@pytest.fixture
+def make_task(test_db):
+    """Create and commit a household task; defaults to an active rolling task."""
+    def _make(**fields):
+        task = HouseholdTask(**{"schedule_mode": "rolling", "is_active": True, **fields})
         test_db.add(task)
-    test_db.commit()
+        test_db.commit()
+        return task
+    return _make
+
+
+SAMPLE_HOUSEHOLD_TASKS = (
+    {"id": 1, "title": "Take out trash", "description": "Take trash and recycling bins to curb", "frequency": "weekly", "sort_order": 1, "is_active": True},
+    {"id": 2, "title": "Replace HVAC filter", "description": "Replace air conditioning/heating filter", "frequency": "monthly", "sort_order": 2, "is_active": True},
+    {"id": 3, "title": "Clean gutters", "description": "Remove leaves and debris from gutters", "frequency": "quarterly", "sort_order": 3, "is_active": True},
+    {"id": 4, "title": "Test sump pump", "description": "Test sump pump operation", "frequency": "annual", "sort_order": 4, "is_active": True},
+    {"id": 5, "title": "Inactive task", "description": None, "frequency": "weekly", "sort_order": 5, "is_active": False},
+)
 
-    return tasks
+
+@pytest.fixture(scope="module")
+def seeded_household_tasks(test_engine):
+    """Insert the sample household tasks once for this module and remove them afterwards."""
+    with test_engine.begin() as conn:
+        conn.execute(insert(HouseholdTask), list(SAMPLE_HOUSEHOLD_TASKS))
+
+    yield
+
+    with test_engine.begin() as conn:
+        conn.execute(delete(HouseholdTask))
+
+
+@pytest.fixture
+def sample_household_tasks(seeded_household_tasks):
+    """Return the seeded household task rows (shared across all profiles) for id/title lookups."""
+    return [SimpleNamespace(**row) for row in SAMPLE_HOUSEHOLD_TASKS]
 
 
 def test_get_all_household_tasks(test_db, sample_household_tasks):
@@ -113,9 +109,10 @@ def test_create_household_task(test_db):
     assert task.is_active is True
 
     # Verify it's in the database
-    db_task = test_db.query(HouseholdTask).filter(HouseholdTask.id == task.id).first()
-    assert db_task is not None
-    assert db_task.title == "Mow lawn"
+    db_title = test_db.execute(
+        select(HouseholdTask.title).where(HouseholdTask.id == task.id)
+    ).scalar_one_or_none()
+    assert db_title == "Mow lawn"
 
 
 def test_update_household_task(test_db, sample_household_tasks):
@@ -153,17 +150,19 @@ def test_delete_household_task(test_db, sample_household_tasks):
     assert success is True
 
     # Verify task is deleted
-    db_task = test_db.query(HouseholdTask).filter(HouseholdTask.id == task.id).first()
-    assert db_task is None
+    db_task_id = test_db.execute(
+        select(HouseholdTask.id).where(HouseholdTask.id == task.id)
+    ).scalar_one_or_none()
+    assert db_task_id is None
 
     # Verify completion is cascade deleted
-    db_completion = test_db.query(HouseholdCompletion).filter(
-        HouseholdCompletion.household_task_id == task.id
+    db_completion_id = test_db.execute(
+        select(HouseholdCompletion.id).where(HouseholdCompletion.household_task_id == task.id)
     ).first()
-    assert db_completion is None
+    assert db_completion_id is None
 
 
-def test_mark_task_complete_with_attribution(test_db, sample_household_tasks, sample_profiles):
+def test_mark_task_complete_with_attribution(test_db, sample_household_tasks):
     """Test marking a task complete with profile attribution."""
     task = sample_household_tasks[0]
 
@@ -182,16 +181,16 @@ def test_mark_task_complete_with_attribution(test_db, sample_household_tasks, sa
     assert completion.completed_at is not None
 
 
-def test_get_last_completion(test_db, sample_household_tasks, sample_profiles):
+def test_get_last_completion(test_db, sample_household_tasks):
     """Test getting the most recent completion for a task."""
     task = sample_household_tasks[0]
 
     # Create multiple completions
-    with freeze_time("2025-12-01 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
-
-    with freeze_time("2025-12-10 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=2)
+    test_db.execute(insert(HouseholdCompletion), [
+        {"household_task_id": task.id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 1, 12, 0, 0)},
+        {"household_task_id": task.id, "completed_by_profile_id": 2, "completed_at": datetime(2025, 12, 10, 12, 0, 0)},
+    ])
+    test_db.commit()
 
     # Get last completion
     last_completion = household_service.get_last_completion(test_db, task.id)
@@ -200,16 +199,29 @@ def test_get_last_completion(test_db, sample_household_tasks, sample_profiles):
     assert last_completion.completed_by_profile_id == 2  # Most recent
 
 
-def test_get_completion_history(test_db, sample_household_tasks, sample_profiles):
+def test_get_last_completion_with_profile_name(test_db, sample_household_tasks):
+    """Test that the last completion comes back with its completer's name in one lookup."""
+    task = sample_household_tasks[0]
+
+    assert household_service.get_last_completion_with_profile_name(test_db, task.id) == (None, None)
+
+    household_service.mark_task_complete(test_db, task.id, profile_id=2)
+
+    completion, profile_name = household_service.get_last_completion_with_profile_name(test_db, task.id)
+    assert completion.completed_by_profile_id == 2
+    assert profile_name == "Test Profile 2"
+
+
+def test_get_completion_history(test_db, sample_household_tasks):
     """Test getting completion history with profile names."""
     task = sample_household_tasks[0]
 
     # Create completions by different profiles
-    with freeze_time("2025-12-01 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1, notes="Done by profile 1")
-
-    with freeze_time("2025-12-05 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=2, notes="Done by profile 2")
+    test_db.execute(insert(HouseholdCompletion), [
+        {"household_task_id": task.id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 1, 12, 0, 0), "notes": "Done by profile 1"},
+        {"household_task_id": task.id, "completed_by_profile_id": 2, "completed_at": datetime(2025, 12, 5, 12, 0, 0), "notes": "Done by profile 2"},
+    ])
+    test_db.commit()
 
     # Get history
     history = household_service.get_completion_history(test_db, task.id, limit=10)
@@ -239,20 +251,15 @@ def test_get_task_with_status_never_completed(test_db, sample_household_tasks):
     assert status["is_overdue"] is False  # Never completed = not overdue
 
 
-def test_get_task_with_status_never_completed_future_schedule_not_due(test_db):
+def test_get_task_with_status_never_completed_future_schedule_not_due(test_db, make_task):
     """Never-completed recurring tasks should respect their configured first schedule."""
-    from datetime import datetime
-
-    task = HouseholdTask(
+    task = make_task(
         title="Future monthly task",
         frequency="monthly",
         schedule_mode="calendar",
         recurrence_day_of_month=25,
-        created_at=datetime(2025, 12, 14, 9, 0, 0),
-        is_active=True
+        created_at=datetime(2025, 12, 14, 9, 0, 0)
     )
-    test_db.add(task)
-    test_db.commit()
 
     status = household_service.get_task_with_status(test_db, task.id)
 
@@ -262,48 +269,49 @@ def test_get_task_with_status_never_completed_future_schedule_not_due(test_db):
     assert status["days_until_due"] == 11
 
 
-def test_get_task_with_status_recently_completed(test_db, sample_household_tasks, sample_profiles):
-    """Test task status for a recently completed task."""
-    task = sample_household_tasks[0]  # Weekly task
+def test_frequency_thresholds_read_only():
+    """Test the overdue thresholds per frequency and that they cannot be modified."""
+    assert household_service.FREQUENCY_THRESHOLDS["weekly"] == 7
+    assert household_service.FREQUENCY_THRESHOLDS["monthly"] == 30
+    assert household_service.FREQUENCY_THRESHOLDS["quarterly"] == 90
+    assert household_service.FREQUENCY_THRESHOLDS["annual"] == 365
+    with pytest.raises(TypeError):
+        household_service.FREQUENCY_THRESHOLDS["weekly"] = 1
+
+
+@pytest.mark.parametrize(
+    "days_ago,expected_overdue",
+    [
+        pytest.param(3, False, id="recently-completed"),
+        pytest.param(10, True, id="overdue"),
+    ],
+)
+def test_get_task_with_status_after_completion(test_db, sample_household_tasks, days_ago, expected_overdue):
+    """Test task status for a weekly task completed a few days ago vs. past its threshold."""
+    task = sample_household_tasks[0]  # Weekly task (7 day threshold)
 
-    # Complete task 3 days ago
-    with freeze_time("2025-12-11 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
+    # Complete task days_ago days before the current time (2025-12-14)
+    completed_at = datetime(2025, 12, 14, 12, 0) - timedelta(days=days_ago)
+    test_db.add(HouseholdCompletion(household_task_id=task.id, completed_by_profile_id=1, completed_at=completed_at))
+    test_db.commit()
 
-    # Check status at current time (2025-12-14)
     status = household_service.get_task_with_status(test_db, task.id)
 
     assert status["last_completed_at"] is not None
     assert status["last_completed_by_profile_id"] == 1
     assert status["last_completed_by_profile_name"] == "Test Profile 1"
-    assert status["days_since_completion"] == 3
-    assert status["is_overdue"] is False  # 3 days < 7 days threshold
-
-
-def test_get_task_with_status_overdue(test_db, sample_household_tasks, sample_profiles):
-    """Test task status for an overdue task."""
-    task = sample_household_tasks[0]  # Weekly task (7 day threshold)
-
-    # Complete task 10 days ago
-    with freeze_time("2025-12-04 12:00:00"):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
-
-    # Check status at current time (2025-12-14)
-    status = household_service.get_task_with_status(test_db, task.id)
-
-    assert status["days_since_completion"] == 10
-    assert status["is_overdue"] is True  # 10 days > 7 days threshold
+    assert status["days_since_completion"] == days_ago
+    assert status["is_overdue"] is expected_overdue
 
 
-def test_get_overdue_tasks(test_db, sample_household_tasks, sample_profiles):
+def test_get_overdue_tasks(test_db, sample_household_tasks):
     """Test getting all overdue tasks."""
-    # Complete weekly task 10 days ago (overdue)
-    with freeze_time("2025-12-04 12:00:00"):
-        household_service.mark_task_complete(test_db, sample_household_tasks[0].id, profile_id=1)
-
-    # Complete monthly task 5 days ago (not overdue)
-    with freeze_time("2025-12-09 12:00:00"):
-        household_service.mark_task_complete(test_db, sample_household_tasks[1].id, profile_id=1)
+    # Complete weekly task 10 days ago (overdue) and monthly task 5 days ago (not overdue)
+    test_db.execute(insert(HouseholdCompletion), [
+        {"household_task_id": sample_household_tasks[0].id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 4, 12, 0, 0)},
+        {"household_task_id": sample_household_tasks[1].id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 9, 12, 0, 0)},
+    ])
+    test_db.commit()
 
     # Get overdue tasks
     overdue = household_service.get_overdue_tasks(test_db)
@@ -314,6 +322,22 @@ def test_get_overdue_tasks(test_db, sample_household_tasks, sample_profiles):
     assert overdue[0]["is_overdue"] is True
 
 
+def test_get_all_tasks_with_status_matches_per_task_status(test_db, sample_household_tasks):
+    """Batched status loading should agree with get_task_with_status for every task."""
+    test_db.execute(insert(HouseholdCompletion), [
+        {"household_task_id": sample_household_tasks[0].id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 1, 12, 0, 0)},
+        {"household_task_id": sample_household_tasks[0].id, "completed_by_profile_id": 2, "completed_at": datetime(2025, 12, 4, 12, 0, 0)},
+        {"household_task_id": sample_household_tasks[1].id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 9, 12, 0, 0)},
+    ])
+    test_db.commit()
+
+    batched = household_service.get_all_tasks_with_status(test_db, include_inactive=True)
+
+    assert batched == [household_service.get_task_with_status(test_db, task["id"]) for task in batched]
+    assert batched[0]["last_completed_by_profile_name"] == "Test Profile 2"
+    assert batched[2]["last_completed_at"] is None
+
+
 def test_api_list_tasks_no_profile_header(client, sample_household_tasks):
     """Test that listing tasks works WITHOUT X-Profile-Id header (shared data)."""
     response = client.get("/api/household/tasks")
@@ -323,26 +347,14 @@ def test_api_list_tasks_no_profile_header(client, sample_household_tasks):
     assert len(tasks) == 4  # 4 active tasks
 
 
-def test_api_list_tasks_with_frequency_filter(client, sample_household_tasks):
-    """Test filtering tasks by frequency via API."""
-    response = client.get("/api/household/tasks?frequency=weekly")
-
-    assert response.status_code == 200
-    tasks = response.json()
-    assert len(tasks) == 1
-    assert tasks[0]["frequency"] == "weekly"
-
-
-def test_api_list_tasks_with_biweekly_frequency_filter(client, test_db):
+def test_api_list_tasks_with_biweekly_frequency_filter(client, make_task):
     """Biweekly tasks should be supported by the list filter."""
-    task = HouseholdTask(
+    task = make_task(
         title="Biweekly task",
         frequency="biweekly",
         sort_order=1,
-        is_active=True
+        schedule_mode="calendar"
     )
-    test_db.add(task)
-    test_db.commit()
 
     response = client.get("/api/household/tasks?frequency=biweekly")
 
@@ -381,33 +393,16 @@ def test_api_create_task(client):
     assert task["is_active"] is True
 
 
-def test_api_update_task(client, sample_household_tasks):
-    """Test updating a household task via API."""
-    task = sample_household_tasks[0]
-
-    response = client.put(f"/api/household/tasks/{task.id}", json={
-        "title": "Updated Title",
-        "frequency": "monthly"
-    })
-
-    assert response.status_code == 200
-    updated = response.json()
-    assert updated["title"] == "Updated Title"
-    assert updated["frequency"] == "monthly"
-
-
-def test_api_update_task_can_clear_nullable_fields(client, test_db):
+def test_api_update_task_can_clear_nullable_fields(client, make_task):
     """Explicit null values should clear nullable household task fields."""
-    task = HouseholdTask(
+    task = make_task(
         title="Clearable task",
         description="Needs clearing",
         frequency="todo",
         due_date=date(2025, 12, 20),
         icon="broom",
-        is_active=True
+        schedule_mode="calendar"
     )
-    test_db.add(task)
-    test_db.commit()
 
     response = client.put(
         f"/api/household/tasks/{task.id}",
@@ -434,7 +429,7 @@ def test_api_delete_task(client, sample_household_tasks):
     assert get_response.status_code == 404
 
 
-def test_api_mark_complete_requires_profile_header(client, sample_household_tasks):
+def test_api_mark_complete_requires_profile_header(client, test_db, sample_household_tasks):
     """Test that marking complete REQUIRES X-Profile-Id header (attribution)."""
     task = sample_household_tasks[0]
 
@@ -448,14 +443,23 @@ def test_api_mark_complete_requires_profile_header(client, sample_household_task
     data = response.json()
     assert "completion_id" in data
 
+    # The completion is attributed to the requesting profile
+    completed_by = test_db.execute(
+        select(HouseholdCompletion.completed_by_profile_id).where(HouseholdCompletion.id == data["completion_id"])
+    ).scalar_one()
+    assert completed_by == 1
+
 
-def test_api_get_completion_history(client, sample_household_tasks, sample_profiles):
+def test_api_get_completion_history(client, test_db, sample_household_tasks):
     """Test getting completion history via API."""
     task = sample_household_tasks[0]
 
     # Create completions
-    client.post(f"/api/household/tasks/{task.id}/complete", cookies={"profile_id": "1"})
-    client.post(f"/api/household/tasks/{task.id}/complete", headers={"X-Profile-Id": "2"})
+    test_db.execute(insert(HouseholdCompletion), [
+        {"household_task_id": task.id, "completed_by_profile_id": 1, "completed_at": datetime(2025, 12, 1, 12, 0, 0)},
+        {"household_task_id": task.id, "completed_by_profile_id": 2, "completed_at": datetime(2025, 12, 5, 12, 0, 0)},
+    ])
+    test_db.commit()
 
     # Get history
     response = client.get(f"/api/household/tasks/{task.id}/history")
@@ -466,14 +470,15 @@ def test_api_get_completion_history(client, sample_household_tasks, sample_profi
     assert "completed_by_profile_name" in history[0]
 
 
-def test_api_get_overdue_tasks(client, sample_household_tasks, sample_profiles):
+def test_api_get_overdue_tasks(client, test_db, sample_household_tasks):
     """Test getting overdue tasks via API."""
     # Complete a task 10 days ago to make it overdue
-    with freeze_time("2025-12-04 12:00:00"):
-        client.post(
-            f"/api/household/tasks/{sample_household_tasks[0].id}/complete",
-            cookies={"profile_id": "1"}
-        )
+    test_db.add(HouseholdCompletion(
+        household_task_id=sample_household_tasks[0].id,
+        completed_by_profile_id=1,
+        completed_at=datetime(2025, 12, 4, 12, 0)
+    ))
+    test_db.commit()
 
     # Get overdue tasks
     response = client.get("/api/household/overdue")
@@ -484,7 +489,7 @@ def test_api_get_overdue_tasks(client, sample_household_tasks, sample_profiles):
     assert overdue[0]["is_overdue"] is True
 
 
-def test_household_tasks_shared_across_profiles(client, sample_household_tasks, sample_profiles):
+def test_household_tasks_shared_across_profiles(client, sample_household_tasks):
     """Test that household tasks are visible to all profiles (critical architecture test)."""
     # Get tasks as profile 1
     response1 = client.get("/api/household/tasks", cookies={"profile_id": "1"})
@@ -499,12 +504,13 @@ def test_household_tasks_shared_across_profiles(client, sample_household_tasks,
     assert [t["id"] for t in tasks1] == [t["id"] for t in tasks2]
 
 
-def test_completion_attribution_preserved(client, sample_household_tasks, sample_profiles):
+def test_completion_attribution_preserved(client, test_db, sample_household_tasks):
     """Test that completion attribution is preserved when viewed by different profiles."""
     task = sample_household_tasks[0]
 
     # Profile 1 completes the task
-    client.post(f"/api/household/tasks/{task.id}/complete", cookies={"profile_id": "1"})
+    test_db.add(HouseholdCompletion(household_task_id=task.id, completed_by_profile_id=1))
+    test_db.commit()
 
     # Profile 2 views the task
     response = client.get(f"/api/household/tasks/{task.id}", headers={"X-Profile-Id": "2"})
@@ -515,166 +521,116 @@ def test_completion_attribution_preserved(client, sample_household_tasks, sample
     assert data["last_completed_by_profile_name"] == "Test Profile 1"
 
 
-def test_frequency_threshold_detection():
-    """Test frequency threshold constants are correct."""
-    from app.services.household import FREQUENCY_THRESHOLDS
-
-    assert FREQUENCY_THRESHOLDS["weekly"] == 7
-    assert FREQUENCY_THRESHOLDS["monthly"] == 30
-    assert FREQUENCY_THRESHOLDS["quarterly"] == 90
-    assert FREQUENCY_THRESHOLDS["annual"] == 365
-
-
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_monthly_task_advances_by_30_days(test_db, sample_profiles):
+def test_rolling_monthly_task_advances_by_30_days(test_db, make_task, now):
     """Test that monthly rolling task advances by 30 days from completion date."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
     # Create rolling monthly task with recurrence_day_of_month=1
-    task = HouseholdTask(
+    task = make_task(
         title="Change air filter",
         frequency="monthly",
-        schedule_mode="rolling",
         recurrence_day_of_month=1,
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete on Feb 1st
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    test_db.refresh(task)
     # Should be due in 30 days (March 3rd), NOT Feb 1st again
     expected_date = date(2026, 3, 3)
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-02-10 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_weekly_task_advances_by_7_days(test_db, sample_profiles):
+def test_rolling_weekly_task_advances_by_7_days(test_db, make_task, now):
     """Test that weekly rolling task advances by 7 days from completion date."""
-    from datetime import date
+    now(datetime(2026, 2, 10, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Take out trash",
         frequency="weekly",
-        schedule_mode="rolling",
         recurrence_day_of_week=1,  # Monday
-        next_due_date=date(2026, 2, 10),
-        is_active=True
+        next_due_date=date(2026, 2, 10)
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete on Feb 10th (Tuesday)
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    test_db.refresh(task)
     # Should be due in 7 days (Feb 17th), ignoring day_of_week config
     expected_date = date(2026, 2, 17)
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_biweekly_task_advances_by_14_days(test_db, sample_profiles):
+def test_rolling_biweekly_task_advances_by_14_days(test_db, make_task, now):
     """Test that biweekly rolling task advances by 14 days from completion date."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Deep clean bathroom",
         frequency="biweekly",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(task)
-    test_db.commit()
 
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    test_db.refresh(task)
     expected_date = date(2026, 2, 15)
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-01-15 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_quarterly_task_advances_by_90_days(test_db, sample_profiles):
+def test_rolling_quarterly_task_advances_by_90_days(test_db, make_task, now):
     """Test that quarterly rolling task advances by 90 days from completion date."""
-    from datetime import date
+    now(datetime(2026, 1, 15, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Clean gutters",
         frequency="quarterly",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 1, 15),
-        is_active=True
+        next_due_date=date(2026, 1, 15)
     )
-    test_db.add(task)
-    test_db.commit()
 
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    test_db.refresh(task)
     expected_date = date(2026, 4, 15)
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_annual_task_advances_by_365_days(test_db, sample_profiles):
+def test_rolling_annual_task_advances_by_365_days(test_db, make_task, now):
     """Test that annual rolling task advances by 365 days from completion date."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Service HVAC",
         frequency="annual",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(task)
-    test_db.commit()
 
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    test_db.refresh(task)
     expected_date = date(2027, 2, 1)
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_calendar_vs_rolling_mode_difference(test_db, sample_profiles):
+def test_calendar_vs_rolling_mode_difference(test_db, make_task, now):
     """Test that calendar and rolling modes produce different next_due_dates."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
     # Create two identical monthly tasks with different schedule modes
-    calendar_task = HouseholdTask(
+    calendar_task = make_task(
         title="Calendar task",
         frequency="monthly",
         schedule_mode="calendar",
         recurrence_day_of_month=1,
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    rolling_task = HouseholdTask(
+    rolling_task = make_task(
         title="Rolling task",
         frequency="monthly",
-        schedule_mode="rolling",
         recurrence_day_of_month=1,
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(calendar_task)
-    test_db.add(rolling_task)
-    test_db.commit()
 
     # Complete both on Feb 1st
     household_service.mark_task_complete(test_db, calendar_task.id, profile_id=1)
     household_service.mark_task_complete(test_db, rolling_task.id, profile_id=1)
 
-    test_db.refresh(calendar_task)
-    test_db.refresh(rolling_task)
-
     # Calendar: March 1st (next occurrence of day 1)
     # Rolling: March 3rd (Feb 1 + 30 days)
     assert calendar_task.next_due_date == date(2026, 3, 1)
@@ -682,21 +638,16 @@ def test_calendar_vs_rolling_mode_difference(test_db, sample_profiles):
     assert calendar_task.next_due_date != rolling_task.next_due_date
 
 
-@freeze_time("2026-01-25 12:00:00", tz_offset=-6)  # America/Chicago timezone
-def test_rolling_early_completion_still_uses_actual_date(test_db, sample_profiles):
+def test_rolling_early_completion_still_uses_actual_date(test_db, make_task, now):
     """Test that rolling mode uses actual completion date, not scheduled date."""
-    from datetime import date
+    now(datetime(2026, 1, 25, 12, 0))
 
     # Task is due Feb 1st
-    task = HouseholdTask(
+    task = make_task(
         title="Monthly task",
         frequency="monthly",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete 7 days early (Jan 25th)
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
@@ -707,29 +658,25 @@ def test_rolling_early_completion_still_uses_actual_date(test_db, sample_profile
     assert task.next_due_date == expected_date
 
 
-@freeze_time("2026-03-11 12:00:00", tz_offset=-6)
-def test_get_task_with_status_uses_stored_due_date_for_rolling_monthly_tasks(test_db, sample_profiles):
+def test_get_task_with_status_uses_stored_due_date_for_rolling_monthly_tasks(test_db, make_task, now):
     """Rolling status should use the persisted next_due_date, not calendar recurrence fields."""
-    from datetime import date
-    from freezegun import freeze_time as freeze
+    now(datetime(2026, 3, 11, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Oil wood kitchen stuff",
         frequency="monthly",
-        schedule_mode="rolling",
         recurrence_day_of_month=25,
-        next_due_date=date(2026, 2, 25),
-        is_active=True
+        next_due_date=date(2026, 2, 25)
     )
-    test_db.add(task)
-    test_db.commit()
 
-    with freeze("2026-02-18 12:00:00", tz_offset=-6):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
+    now(datetime(2026, 2, 18, 12, 0))
+    household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
     test_db.refresh(task)
     assert task.next_due_date == date(2026, 3, 20)
 
+    now(datetime(2026, 3, 11, 12, 0))
+
     status = household_service.get_task_with_status(test_db, task.id)
 
     assert status["next_due_date"] == date(2026, 3, 20)
@@ -738,20 +685,15 @@ def test_get_task_with_status_uses_stored_due_date_for_rolling_monthly_tasks(tes
     assert status["days_until_due"] == 9
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)
-def test_undo_last_completion(test_db, sample_profiles):
+def test_undo_last_completion(test_db, make_task, now):
     """Test undoing the most recent completion."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Weekly task",
         frequency="weekly",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 2, 1),
-        is_active=True
+        next_due_date=date(2026, 2, 1)
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete the task
     household_service.mark_task_complete(test_db, task.id, profile_id=1)
@@ -771,47 +713,38 @@ def test_undo_last_completion(test_db, sample_profiles):
     assert completion is None
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)
-def test_undo_completion_no_completions(test_db, sample_profiles):
+def test_undo_completion_no_completions(test_db, make_task, now):
     """Test undoing when there are no completions returns False."""
-    from datetime import date
+    now(datetime(2026, 2, 1, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Monthly task",
         frequency="monthly",
         next_due_date=date(2026, 2, 1),
-        is_active=True
+        schedule_mode="calendar"
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Try to undo without any completions
     success = household_service.undo_last_completion(test_db, task.id)
     assert success is False
 
 
-@freeze_time("2026-02-01 12:00:00", tz_offset=-6)
-def test_undo_completion_multiple_completions(test_db, sample_profiles):
+def test_undo_completion_multiple_completions(test_db, make_task, now):
     """Test undoing only removes the most recent completion."""
-    from datetime import date
-    from freezegun import freeze_time as freeze
+    now(datetime(2026, 2, 1, 12, 0))
 
-    task = HouseholdTask(
+    task = make_task(
         title="Daily task",
         frequency="weekly",
-        schedule_mode="rolling",
-        next_due_date=date(2026, 1, 25),
-        is_active=True
+        next_due_date=date(2026, 1, 25)
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete the task twice on different days
-    with freeze("2026-01-25 12:00:00", tz_offset=-6):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
+    now(datetime(2026, 1, 25, 12, 0))
+    household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
-    with freeze("2026-02-01 12:00:00", tz_offset=-6):
-        household_service.mark_task_complete(test_db, task.id, profile_id=1)
+    now(datetime(2026, 2, 1, 12, 0))
+    household_service.mark_task_complete(test_db, task.id, profile_id=1)
 
     # Should have 2 completions
     history = household_service.get_completion_history(test_db, task.id)
@@ -827,13 +760,13 @@ def test_undo_completion_multiple_completions(test_db, sample_profiles):
     assert history[0]['completed_at'].date() == date(2026, 1, 25)
 
 
-def test_api_undo_completion(client, sample_household_tasks, sample_profiles):
+def test_api_undo_completion(client, test_db, sample_household_tasks):
     """Test the undo completion API endpoint."""
     task = sample_household_tasks[0]
 
     # Complete the task
-    response = client.post(f"/api/household/tasks/{task.id}/complete", cookies={"profile_id": "1"})
-    assert response.status_code == 201
+    test_db.add(HouseholdCompletion(household_task_id=task.id, completed_by_profile_id=1))
+    test_db.commit()
 
     # Undo the completion
     response = client.post(f"/api/household/tasks/{task.id}/undo")
@@ -854,24 +787,19 @@ def test_api_undo_completion_no_completions(client, sample_household_tasks):
     assert "detail" in data
 
 
-@freeze_time("2026-02-10 12:00:00", tz_offset=-6)
-def test_coming_soon_tasks(test_db, sample_profiles):
+def test_coming_soon_tasks(test_db, make_task, now):
     """Test that tasks due within 7 days are marked as coming_soon."""
-    from datetime import timedelta
-    from app.core.time import get_today
+    now(datetime(2026, 2, 10, 12, 0))
 
-    today = get_today()
+    today = household_service.get_today()
 
     # Create a task that will be due in 5 days
-    task = HouseholdTask(
+    task = make_task(
         title="Upcoming task",
         frequency="weekly",
         schedule_mode="calendar",
-        recurrence_day_of_week=0,  # Monday
-        is_active=True
+        recurrence_day_of_week=0  # Monday
     )
-    test_db.add(task)
-    test_db.commit()
 
     # Complete it 9 days ago, so next due date is in 5 days
     # (weekly = 7 days, so completing 9 days ago means next due is 7 - 9 = -2, but with calendar mode it finds next Monday)
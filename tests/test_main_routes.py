@@ -1,4 +1,5 @@
 """Tests for main app web routes."""
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -42,9 +43,28 @@ def test_profiles_route(client: TestClient):
     assert response.headers["content-type"].startswith("text/html")
 
 
+@pytest.mark.parametrize("path", ["/settings", "/profiles", "/fitbit"])
+def test_static_page_etag_returns_not_modified(client: TestClient, path):
+    """Context-free pages are served with an ETag and answer 304 when it matches."""
+    first = client.get(path)
+    etag = first.headers["etag"]
+
+    second = client.get(path)
+    assert second.text == first.text
+    assert second.headers["etag"] == etag
+
+    not_modified = client.get(path, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    stale = client.get(path, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
 def test_health_endpoint(client: TestClient):
     """Test the health check endpoint."""
     response = client.get("/health")
 
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     assert response.json() == {"status": "healthy"}
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from fastapi.testclient import TestClient
+from app.models.profile import Profile
 
 
 def test_list_profiles(client: TestClient, sample_profiles):
@@ -105,23 +106,19 @@ def test_update_nonexistent_profile(client: TestClient, sample_profiles):
     assert response.status_code == 404
 
 
-def test_delete_profile(client: TestClient, sample_profiles):
+def test_delete_profile(client: TestClient, test_db: Session, sample_profiles):
     """Test deleting a profile."""
     response = client.delete("/api/profiles/2")
     assert response.status_code == 204
 
     # Verify profile is deleted
-    response = client.get("/api/profiles/2")
-    assert response.status_code == 404
+    assert test_db.get(Profile, 2) is None
 
 
-def test_delete_last_profile_fails(client: TestClient, test_db: Session):
+def test_delete_last_profile_fails(client: TestClient, test_db: Session, sample_profiles):
     """Test that deleting the last profile fails."""
-    from app.models.profile import Profile
-
-    # Create only one profile
-    profile = Profile(id=1, name="Only Profile", color="#3b82f6")
-    test_db.add(profile)
+    # Leave only one profile
+    test_db.delete(sample_profiles[1])
     test_db.commit()
 
     response = client.delete("/api/profiles/1")
@@ -144,7 +141,7 @@ def test_profile_data_isolation(test_db: Session, sample_profiles):
     # Create tasks for profile 2
     task2 = Task(user_id=2, title="Profile 2 Task", sort_order=1, is_required=True, is_active=True, active_since=past_date)
     test_db.add(task2)
-    test_db.commit()
+    test_db.flush()
 
     # Query tasks for profile 1
     tasks_p1 = task_service.get_tasks(test_db, profile_id=1)
@@ -1,11 +1,32 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import timedelta, date
 from app.services import streaks as streak_service
 from app.services import checks as check_service
 from app.models.daily_status import DailyStatus
+from app.models.task_check import TaskCheck
 from app.core.time import get_today, get_now
 
 
+def _seed_daily_statuses(test_db: Session, dates, profile_id: int = 1):
+    """Insert completed DailyStatus rows for the given dates in one statement."""
+    completed_at = get_now()
+    test_db.execute(insert(DailyStatus), [
+        {"date": day, "user_id": profile_id, "completed_at": completed_at} for day in dates
+    ])
+    test_db.flush()
+
+
+def _seed_task_checks(test_db: Session, task_id: int, dates, profile_id: int = 1):
+    """Insert checked TaskCheck rows for one task on the given dates in one statement."""
+    checked_at = get_now()
+    test_db.execute(insert(TaskCheck), [
+        {"date": day, "task_id": task_id, "user_id": profile_id, "checked": True, "checked_at": checked_at}
+        for day in dates
+    ])
+    test_db.flush()
+
+
 def test_no_streak_on_empty_db(test_db: Session, sample_profiles):
     """Test that streak is 0 when no days are completed."""
     streak_count, last_date = streak_service.calculate_current_streak(test_db, profile_id=1)
@@ -18,7 +39,7 @@ def test_single_day_streak(test_db: Session, sample_profiles):
     today = get_today()
     status = DailyStatus(date=today, user_id=1, completed_at=get_now())
     test_db.add(status)
-    test_db.commit()
+    test_db.flush()
 
     streak_count, last_date = streak_service.calculate_current_streak(test_db, profile_id=1)
     assert streak_count == 1
@@ -29,11 +50,7 @@ def test_consecutive_days_streak(test_db: Session, sample_profiles):
     """Test streak increments for consecutive days."""
     today = get_today()
 
-    for i in range(5):
-        day = today - timedelta(days=i)
-        status = DailyStatus(date=day, user_id=1, completed_at=get_now())
-        test_db.add(status)
-    test_db.commit()
+    _seed_daily_statuses(test_db, [today - timedelta(days=i) for i in range(5)])
 
     streak_count, last_date = streak_service.calculate_current_streak(test_db, profile_id=1)
     assert streak_count == 5
@@ -48,14 +65,14 @@ def test_streak_resets_on_missed_day(test_db: Session, sample_profiles):
     status2 = DailyStatus(date=today - timedelta(days=1), user_id=1, completed_at=get_now())
     test_db.add(status1)
     test_db.add(status2)
-    test_db.commit()
+    test_db.flush()
 
     streak_count, last_date = streak_service.calculate_current_streak(test_db, profile_id=1)
     assert streak_count == 2
 
     status3 = DailyStatus(date=today - timedelta(days=4), user_id=1, completed_at=get_now())
     test_db.add(status3)
-    test_db.commit()
+    test_db.flush()
 
     streak_count, last_date = streak_service.calculate_current_streak(test_db, profile_id=1)
     assert streak_count == 2
@@ -68,7 +85,7 @@ def test_get_streak_info(test_db: Session, sample_tasks):
     yesterday = today - timedelta(days=1)
     status = DailyStatus(date=yesterday, user_id=1, completed_at=get_now())
     test_db.add(status)
-    test_db.commit()
+    test_db.flush()
 
     check_service.ensure_checks_exist_for_date(test_db, today, profile_id=1)
     check_service.update_task_check(test_db, today, 1, True, profile_id=1)
@@ -87,11 +104,7 @@ def test_today_incomplete_shows_previous_streak(test_db: Session, sample_profile
     today = get_today()
     yesterday = today - timedelta(days=1)
 
-    for i in range(3):
-        day = yesterday - timedelta(days=i)
-        status = DailyStatus(date=day, user_id=1, completed_at=get_now())
-        test_db.add(status)
-    test_db.commit()
+    _seed_daily_statuses(test_db, [yesterday - timedelta(days=i) for i in range(3)])
 
     streak_info = streak_service.get_streak_info(test_db, profile_id=1)
 
@@ -112,10 +125,7 @@ def test_task_streak_consecutive_days(test_db: Session, sample_tasks):
     today = get_today()
 
     # Create checks for 5 consecutive days for task 1
-    for i in range(5):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=1)
-        check_service.update_task_check(test_db, day, task_id=1, checked=True, profile_id=1)
+    _seed_task_checks(test_db, 1, [today - timedelta(days=i) for i in range(5)])
 
     streak_count, last_date = streak_service.calculate_task_streak(test_db, task_id=1, profile_id=1)
     assert streak_count == 5
@@ -126,18 +136,8 @@ def test_task_streak_with_gap(test_db: Session, sample_tasks):
     """Test streak resets after missed day."""
     today = get_today()
 
-    # Check days 1-3
-    for i in range(3):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=1)
-        check_service.update_task_check(test_db, day, task_id=1, checked=True, profile_id=1)
-
-    # Skip day 4 (today - 3)
-
-    # Check day 5 (today - 4)
-    day5 = today - timedelta(days=4)
-    check_service.ensure_checks_exist_for_date(test_db, day5, profile_id=1)
-    check_service.update_task_check(test_db, day5, task_id=1, checked=True, profile_id=1)
+    # Check days 1-3, skip day 4 (today - 3), check day 5 (today - 4)
+    _seed_task_checks(test_db, 1, [today - timedelta(days=i) for i in (0, 1, 2, 4)])
 
     # Streak should only count the most recent consecutive days (1-3)
     streak_count, last_date = streak_service.calculate_task_streak(test_db, task_id=1, profile_id=1)
@@ -150,16 +150,10 @@ def test_task_streak_different_tasks(test_db: Session, sample_tasks):
     today = get_today()
 
     # Task 1: 10 consecutive days
-    for i in range(10):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=1)
-        check_service.update_task_check(test_db, day, task_id=1, checked=True, profile_id=1)
+    _seed_task_checks(test_db, 1, [today - timedelta(days=i) for i in range(10)])
 
     # Task 2: 3 consecutive days
-    for i in range(3):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=1)
-        check_service.update_task_check(test_db, day, task_id=2, checked=True, profile_id=1)
+    _seed_task_checks(test_db, 2, [today - timedelta(days=i) for i in range(3)])
 
     streak1, _ = streak_service.calculate_task_streak(test_db, task_id=1, profile_id=1)
     streak2, _ = streak_service.calculate_task_streak(test_db, task_id=2, profile_id=1)
@@ -174,8 +168,7 @@ def test_task_streak_broken_returns_zero(test_db: Session, sample_tasks):
 
     # Check task 5 days ago (gap > 1 day)
     old_day = today - timedelta(days=5)
-    check_service.ensure_checks_exist_for_date(test_db, old_day, profile_id=1)
-    check_service.update_task_check(test_db, old_day, task_id=1, checked=True, profile_id=1)
+    _seed_task_checks(test_db, 1, [old_day])
 
     streak_count, last_date = streak_service.calculate_task_streak(test_db, task_id=1, profile_id=1)
     assert streak_count == 0
@@ -189,10 +182,7 @@ def test_task_streak_profile_isolation(test_db: Session, sample_profiles, sample
     today = get_today()
 
     # Profile 1: 5 day streak on task 1
-    for i in range(5):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=1)
-        check_service.update_task_check(test_db, day, task_id=1, checked=True, profile_id=1)
+    _seed_task_checks(test_db, 1, [today - timedelta(days=i) for i in range(5)])
 
     # Create a task for profile 2
     past_date = date(2025, 1, 1)
@@ -206,13 +196,10 @@ def test_task_streak_profile_isolation(test_db: Session, sample_profiles, sample
         active_since=past_date
     )
     test_db.add(task_p2)
-    test_db.commit()
+    test_db.flush()
 
     # Profile 2: 2 day streak on task 10
-    for i in range(2):
-        day = today - timedelta(days=i)
-        check_service.ensure_checks_exist_for_date(test_db, day, profile_id=2)
-        check_service.update_task_check(test_db, day, task_id=10, checked=True, profile_id=2)
+    _seed_task_checks(test_db, 10, [today - timedelta(days=i) for i in range(2)], profile_id=2)
 
     streak1 = streak_service.calculate_task_streak(test_db, task_id=1, profile_id=1)
     streak2 = streak_service.calculate_task_streak(test_db, task_id=10, profile_id=2)
@@ -66,15 +66,14 @@ def test_update_task(client: TestClient, sample_tasks):
     assert data["is_required"] is False
 
 
-def test_delete_task(client: TestClient, sample_tasks):
+def test_delete_task(client: TestClient, test_db: Session, sample_tasks):
     """Test deleting a task."""
     response = client.delete("/api/tasks/1")
 
     assert response.status_code == 204
 
-    response = client.get("/api/tasks")
-    tasks = response.json()
-    assert len(tasks) == 2
+    tasks = task_service.get_tasks(test_db, profile_id=1)
+    assert [task.id for task in tasks] == [2, 3]
 
 
 def test_create_task_with_fitbit_auto_check_missing_metric_type(client: TestClient, sample_profiles):